@@ -18,6 +18,36 @@ from ymery.types import Object
 from ymery.backend.types import Buffer
 from ymery.result import Result, Ok
 
+# Cache line size, also the width of an AVX-512 register
+BUFFER_ALIGNMENT = 64
+
+# Returned by mediated buffers when the source has no data, shared so misses don't allocate
+_EMPTY = np.empty(0, dtype=np.float32)
+_EMPTY.setflags(write=False)
+
+
+def aligned_empty(size: int, dtype=np.float32, alignment: int = BUFFER_ALIGNMENT) -> np.ndarray:
+    """Allocate an uninitialized 1D array whose data starts on an alignment byte boundary.
+
+    numpy only guarantees the alignment of the dtype, so the array is carved out of a
+    slightly larger allocation at the first aligned offset.
+    """
+    itemsize = np.dtype(dtype).itemsize
+    raw = np.empty(size * itemsize + alignment, dtype=np.uint8)
+    offset = -raw.ctypes.data % alignment
+    return raw[offset:offset + size * itemsize].view(dtype)
+
+
+def _copy_tail(dst: np.ndarray, src: Optional[np.ndarray], start: int = 0, length: Optional[int] = None) -> int:
+    """Copy the last samples of src[start:start + length] that fit to the start of dst."""
+    if src is None:
+        return 0
+    end = len(src) if length is None else min(start + length, len(src))
+    n = max(0, min(len(dst), end - start))
+    dst[:n] = src[end - n:end]
+    return n
+
+
 class AudioBufferRange:
     def __init__(self, start: int, length: int):
         pass
@@ -66,6 +96,37 @@ class AudioBuffer(Buffer):
         """
         pass
 
+    def snapshot(self) -> Optional[np.ndarray]:
+        """
+        copy of data that stays valid without holding the lock
+        the default copies under lock/unlock, dynamic buffers may read without blocking the writer
+        """
+        self.lock()
+        try:
+            data = self.data
+            return None if data is None else data.copy()
+        finally:
+            self.unlock()
+
+    def snapshot_into(self, dst: np.ndarray, start: int = 0, length: Optional[int] = None) -> int:
+        """
+        copy the most recent samples of data[start:start + length] into a caller owned array, without blocking
+        returns the number of samples copied to the start of dst, 0 if the buffer is busy or empty
+        """
+        if not self.try_lock():
+            return 0
+        try:
+            return _copy_tail(dst, self.data, start, length)
+        finally:
+            self.unlock()
+
+    @property
+    def is_static(self) -> bool:
+        """
+        true if data never changes once loaded, so readers may use it without the lock or a copy
+        """
+        return False
+
 
 class DynamicAudioBuffer(AudioBuffer):
     """
@@ -83,6 +144,9 @@ class DynamicAudioRingBuffer(DynamicAudioBuffer):
     Logical buffer size: N (exposed to clients)
     Write pointer wraps at: N
 
+    Every sample is written twice, at ptr and at ptr+N, so [ptr:ptr+N] always
+    holds the last N samples in order and wrapping never copies a whole half.
+
     Features:
     - Per-channel separate numpy arrays (lazy allocation)
     - Active/frozen channel management
@@ -90,6 +154,8 @@ class DynamicAudioRingBuffer(DynamicAudioBuffer):
     - Continuous views without wrap-around
     """
 
+    SNAPSHOT_RETRIES = 3  # Lock free attempts of snapshot() before falling back to the lock
+
     def __init__(self, sample_rate: int, initial_size: int = 0,
                  period_size: Optional[int] = None, format_type: type = np.float32):
         """Initialize dynamic ring buffer for ONE channel.
@@ -121,18 +187,44 @@ class DynamicAudioRingBuffer(DynamicAudioBuffer):
         self._active = False  # Has mediated buffers attached
         self._frozen = False  # Allocated but not updating
 
-        self._ptr = 0  # Write pointer (wraps at _buffer_size)
+        self._ptr = 0  # Write pointer in [0, N)
         self._has_wrapped = False  # Track if we've wrapped around at least once
         self._lock = threading.Lock()
 
+        # Bumped before and after every change of the storage, odd while one is in progress,
+        # so snapshot() can detect a concurrent write without taking the lock (single writer)
+        self._write_seq = 0
+
+        self._reserved = None  # Storage the view handed out by reserve() belongs to
+
     def _round_to_period(self, size: int) -> int:
         """Round size up to multiple of period size."""
         return ((size + self._period_size - 1) // self._period_size) * self._period_size
 
+    def _new_storage(self) -> np.ndarray:
+        """Allocate double-depth storage for the current sizes.
+
+        Left uninitialized: from ptr 0 every sample is written before data exposes it.
+        Aligned, so with a period size that is a multiple of the alignment both halves
+        and every view starting on a period boundary are aligned too.
+        """
+        return aligned_empty(self._physical_size, self._format)
+
     def _allocate(self):
         """Allocate buffer (lazy allocation)."""
         if self._buffer is None:
-            self._buffer = np.zeros(self._physical_size, dtype=self._format)
+            self._buffer = self._new_storage()
+            # Fresh storage holds no samples, whatever ptr was before deactivation
+            self._ptr = 0
+            self._has_wrapped = False
+
+    def _advance(self, n: int):
+        """Move ptr past n samples, wrapping at N (caller holds the lock)."""
+        ptr = self._ptr + n
+        if ptr >= self._buffer_size:
+            ptr %= self._buffer_size
+            self._has_wrapped = True
+        self._ptr = ptr
 
     def activate(self):
         """Activate buffer (first mediated buffer attached)."""
@@ -193,39 +285,42 @@ class DynamicAudioRingBuffer(DynamicAudioBuffer):
             return
 
         self.lock()
+        self._write_seq += 1
         try:
             old_length = self._buffer_size
             old_physical = self._physical_size
             old_ptr = self._ptr
 
+            # Get the useful data from old buffer before resizing, while the sizes still match it
+            old_useful_data = self.data  # This handles the double-depth logic correctly
+
             # Update sizes
             self._buffer_size = new_length
             self._physical_size = new_length * 2
 
             # Resize buffer if allocated
             if self._buffer is not None:
-                # Get the useful data from old buffer before resizing
-                old_useful_data = self.data  # This handles the double-depth logic correctly
-
                 # Allocate new double-depth buffer
-                new_buffer = np.zeros(self._physical_size, dtype=self._format)
+                new_buffer = self._new_storage()
 
-                # Copy useful data to new buffer (up to new_length samples)
-                if old_useful_data is not None and len(old_useful_data) > 0:
-                    data_to_copy = min(len(old_useful_data), new_length)
-                    new_buffer[:data_to_copy] = old_useful_data[-data_to_copy:]
+                # Copy useful data to new buffer (up to new_length samples). No mirror copy:
+                # with ptr restarting at 0 or after the copied samples, data only exposes
+                # [N:N+ptr] after later writes have mirrored into it
+                data_to_copy = min(len(old_useful_data), new_length)
+                if data_to_copy > 0:
+                    new_buffer[:data_to_copy] = old_useful_data[len(old_useful_data) - data_to_copy:]
 
                 self._buffer = new_buffer
 
-                # Reset pointer to amount of data copied
-                self._ptr = min(len(old_useful_data) if old_useful_data is not None else 0, new_length)
+                # Reset pointer to amount of data copied, a full buffer starts wrapped
+                self._has_wrapped = data_to_copy == new_length
+                self._ptr = 0 if self._has_wrapped else data_to_copy
             else:
                 # Buffer not yet allocated, just reset pointer
                 self._ptr = 0
-
-            # Reset wrap flag (new cycle starts)
-            self._has_wrapped = False
+                self._has_wrapped = False
         finally:
+            self._write_seq += 1
             self.unlock()
 
 
@@ -242,45 +337,105 @@ class DynamicAudioRingBuffer(DynamicAudioBuffer):
 
         Double-depth ring buffer mechanics:
         - Physical size: 2N, logical size: N
-        - ptr goes from 0 to 2N
-        - When ptr reaches N: copy second half [N:2N] → first half [0:N], continue writing from N
-        - When ptr reaches 2N: copy second half [N:2N] → first half [0:N], wrap ptr to N
+        - ptr goes from 0 to N and wraps back to 0
+        - Each chunk is written at [ptr:ptr+n] and mirrored at [ptr+N:ptr+N+n],
+          so a write costs O(n) and nothing is copied when ptr wraps
 
         Args:
             data: Numpy array of samples (1D array for single channel)
         """
         self.lock()
+        self._write_seq += 1
         try:
             n = len(data)  # Number of samples
 
-            # Write if active and not frozen
-            if self._active and not self._frozen:
-                if self._buffer is None:
-                    self._allocate()
-
-                # Check if we need to wrap BEFORE writing
-                if self._ptr >= self._physical_size:
-                    # Reached end of physical buffer (2N)
-                    # Copy second half to first half
-                    self._buffer[:self._buffer_size] = \
-                        self._buffer[self._buffer_size:self._physical_size]
-                    # Wrap pointer back to N (middle of physical buffer)
-                    self._ptr = self._buffer_size
-
-                # Check if we crossed the logical boundary (N)
-                if self._ptr >= self._buffer_size and not self._has_wrapped:
-                    # First time crossing N
-                    # Copy second half to first half
-                    self._buffer[:self._buffer_size] = \
-                        self._buffer[self._buffer_size:self._physical_size]
-                    self._has_wrapped = True
-
-                # Write at current position
-                self._buffer[self._ptr:self._ptr+n] = data
-
-            # Advance pointer
-            self._ptr += n
+            # Nothing is stored, and the view keeps still, while inactive or frozen
+            if not self._active or self._frozen:
+                return
+
+            buffer = self._buffer
+            if buffer is None:
+                self._allocate()
+                buffer = self._buffer
+            size = self._buffer_size
+            ptr = self._ptr
+
+            # Write at current position
+            if ptr + n < size:
+                buffer[ptr:ptr + n] = data
+                buffer[ptr + size:ptr + size + n] = data
+                self._ptr = ptr + n
+                return
+
+            # Older samples than the last N would be overwritten within this write
+            if n > size:
+                ptr = (ptr + n - size) % size
+                data = data[n - size:]
+                n = size
+
+            # Split where ptr wraps: the tail up to N, then the rest from 0
+            head = size - ptr
+            buffer[ptr:size] = data[:head]
+            buffer[ptr + size:size + size] = data[:head]
+            rest = n - head
+            buffer[:rest] = data[head:]
+            buffer[size:size + rest] = data[head:]
+            self._ptr = rest
+            self._has_wrapped = True
         finally:
+            self._write_seq += 1
+            self.unlock()
+
+    def reserve(self, n: int) -> Optional[np.ndarray]:
+        """Get a view of the next samples for a producer that fills them in place.
+
+        The view ends where ptr wraps at N, so it can be shorter than n: fill
+        it, call commit() with its length and reserve again for the rest.
+        It is the mirror copy at ptr+N, which data never exposes, so readers do
+        not see the samples until commit().
+
+        Args:
+            n: Number of samples the producer wants to write
+
+        Returns:
+            Writable view of at most n samples at ptr, or None if the buffer is
+            inactive or frozen (the samples are dropped, commit() does nothing)
+        """
+        self.lock()
+        try:
+            if not self._active or self._frozen:
+                return None
+            if self._buffer is None:
+                self._allocate()
+            size = self._buffer_size
+            self._reserved = self._buffer
+            return self._buffer[self._ptr + size:min(self._ptr + n, size) + size]
+        finally:
+            self.unlock()
+
+    def commit(self, n: int):
+        """Advance the write pointer past n samples filled through reserve().
+
+        Copies the filled samples from the mirror half before advancing. Does
+        nothing if reserve() returned None, or if the storage was replaced by a
+        resize or close since, then the samples are lost.
+
+        Args:
+            n: Number of samples written into the reserved view
+        """
+        self.lock()
+        self._write_seq += 1
+        try:
+            reserved = self._reserved
+            self._reserved = None
+            if reserved is not None and reserved is self._buffer:
+                ptr = self._ptr
+                size = self._buffer_size
+                count = min(n, size - ptr)
+                self._buffer[ptr:ptr + count] = self._buffer[ptr + size:ptr + size + count]
+                self._advance(count)
+        finally:
+            self._write_seq += 1
             self.unlock()
 
 
@@ -292,9 +447,9 @@ class DynamicAudioRingBuffer(DynamicAudioBuffer):
         ending at the current write position.
 
         With double-depth ring buffer:
-        - ptr ranges from 0 to 2N
-        - Before first wrap (ptr < N): return [0:ptr]
-        - After wrap (ptr >= N): return most recent N samples = [ptr-N:ptr]
+        - ptr ranges from 0 to N
+        - Before first wrap: return [0:ptr]
+        - After wrap: return most recent N samples = [ptr:ptr+N]
 
         WARNING: Caller must lock/unlock before/after accessing this property!
 
@@ -305,14 +460,56 @@ class DynamicAudioRingBuffer(DynamicAudioBuffer):
         if self._buffer is None:
             return None
 
-        # Before reaching N, return all samples written so far
-        if self._ptr < self._buffer_size:
+        # Before the first wrap, return all samples written so far
+        if not self._has_wrapped:
             return self._buffer[0:self._ptr]
 
-        # After reaching N, always return the most recent N samples
-        # ptr ranges from N to 2N, so [ptr-N:ptr] gives us the last N samples
-        start = self._ptr - self._buffer_size
-        return self._buffer[start:self._ptr]
+        # After wrapping, [ptr:N] holds the older samples and their mirror
+        # [N:N+ptr] the newer ones, which gives the last N samples in order
+        return self._buffer[self._ptr:self._ptr + self._buffer_size]
+
+    def snapshot(self) -> Optional[np.ndarray]:
+        """Copy the useful data without taking the lock, so the writer is never blocked.
+
+        Seqlock style read for a single writer: the copy is kept only if no write
+        started or finished while it was taken, otherwise it is retried, and after a
+        few attempts taken under the lock.
+
+        Returns:
+            Copy of the most recent samples, or None if not allocated
+        """
+        for _ in range(self.SNAPSHOT_RETRIES):
+            seq = self._write_seq
+            if seq & 1:
+                continue
+            view = self.data
+            copy = None if view is None else view.copy()
+            if self._write_seq == seq:
+                return copy
+        return super().snapshot()
+
+    def snapshot_into(self, dst: np.ndarray, start: int = 0, length: Optional[int] = None) -> int:
+        """Copy the most recent samples into a caller owned array without blocking.
+
+        Same seqlock read as snapshot(), falling back to try_lock() instead of
+        the blocking lock, so a busy buffer is skipped rather than waited for.
+
+        Args:
+            dst: Destination array, filled from the start
+            start: Start of the copied range within data
+            length: Length of the copied range, None for the rest of data
+
+        Returns:
+            Number of samples copied, at most len(dst), 0 if busy or not allocated
+        """
+        for _ in range(self.SNAPSHOT_RETRIES):
+            seq = self._write_seq
+            if seq & 1:
+                continue
+            n = _copy_tail(dst, self.data, start, length)
+            if self._write_seq == seq:
+                return n
+        return super().snapshot_into(dst, start, length)
 
     def init(self) -> Result[None]:
         """Initialize buffer (already done in __init__)."""
@@ -349,9 +546,12 @@ class MediatedAudioBuffer(AudioBuffer):
         """
         super().__init__()
         self._mediator = mediator
-        self._start = 0  # Start position for slicing
+        self._start = 0 if start is None else start  # Start position for slicing
         self._length = 65536 if length is None else length # Default length
 
+        # Last slice and the source array it was taken from, reused while both stay the same
+        self._view = None
+        self._view_source = None
 
     def set_range(self, start: int, length: int):
         """Set view range (atomic update).
@@ -360,10 +560,12 @@ class MediatedAudioBuffer(AudioBuffer):
             start: Start position for slicing
             length: Number of samples
         """
+        old_end = self._start + self._length
         self._start = start
         self._length = length
+        self._view_source = None
         # Notify mediator to resize source buffer if needed
-        self._mediator._resize_source_if_needed()
+        self._mediator._range_changed(old_end, start + length)
 
     @property
     def data(self) -> np.ndarray:
@@ -377,19 +579,52 @@ class MediatedAudioBuffer(AudioBuffer):
         """
         source_data = self._mediator.data
         if source_data is None:
-            return np.array([])
+            return _EMPTY
+
+        # Static buffers and unchanged on-demand views return the same source array,
+        # the same view is then handed out, so consumers can cache on its identity
+        if source_data is self._view_source:
+            return self._view
 
-        # Clamp slice to available data
-        # For dynamic buffers, source_data.length may be less than requested
-        available = len(source_data)
-        start = min(self._start, available)
-        end = min(self._start + self._length, available)
+        # For dynamic buffers, source_data.length may be less than requested,
+        # slicing clamps both bounds to the available data
+        start = self._start
+        view = source_data[start:start + self._length]
+        self._view = view
+        self._view_source = source_data
+        return view
 
-        return source_data[start:end]
+    def snapshot(self) -> np.ndarray:
+        """Get a copy of the sliced channel data that stays valid without the lock.
+
+        Returns:
+            Numpy array or empty array
+        """
+        source_data = self._mediator.snapshot()
+        if source_data is None:
+            return _EMPTY
+
+        start = self._start
+        return source_data[start:start + self._length]
+
+    def snapshot_into(self, dst: np.ndarray) -> int:
+        """Copy the most recent samples of the sliced channel data into a caller owned array.
+
+        Goes through the source's own snapshot_into(), so ring buffers use their lock free read.
+
+        Returns:
+            Number of samples copied, 0 if the source is busy or empty
+        """
+        return self._mediator.snapshot_into(dst, self._start, self._length)
+
+    @property
+    def is_static(self) -> bool:
+        """Static when the source is."""
+        return self._mediator.backend.is_static
 
     def close(self):
         """Close this mediated buffer and notify mediator."""
-        self._mediator._remove_mediated_buffer(self._mediated_id)
+        self._mediator._remove_mediated_buffer(self.uid)
 
     def init(self) -> Result[None]:
         """Initialize (already done in __init__)."""
@@ -425,14 +660,20 @@ class MediatedAudioBuffer(AudioBuffer):
         set's the buffer start.
         start is relative to the "parents" buffer if any
         """
+        old_end = self._start + self._length
         self._start = start
+        self._view_source = None
+        self._mediator._range_changed(old_end, start + self._length)
 
     def set_length(self, length: int):
         """
         set's the buffer length 
         start is relative to the "parents" buffer if any
         """
+        old_end = self._start + self._length
         self._length = length
+        self._view_source = None
+        self._mediator._range_changed(old_end, self._start + length)
 
     def dispose(self) -> Result[None]:
         return Ok(None)
@@ -456,6 +697,7 @@ class AudioBufferMediator(Object):
         """
         self._backend = backend
         self._mediated_buffers = {}
+        self._max_end = 0  # Largest start + length of the mediated buffers
 
     @property
     def backend(self):
@@ -471,6 +713,17 @@ class AudioBufferMediator(Object):
         pass
 
 
+    def _add_mediated_buffer(self, mediated_buffer: MediatedAudioBuffer):
+        """Register a mediated buffer and include its range in the maximum end.
+
+        Args:
+            mediated_buffer: Newly created mediated buffer
+        """
+        self._mediated_buffers[mediated_buffer.uid] = mediated_buffer
+        end = mediated_buffer._start + mediated_buffer._length
+        if end > self._max_end:
+            self._max_end = end
+
     def _remove_mediated_buffer(self, mediated_id: str) -> Result[None]:
         """Remove a mediated buffer and update source.
 
@@ -480,20 +733,42 @@ class AudioBufferMediator(Object):
         if mediated_id not in self._mediated_buffers:
             return Result.error(f"{mediated_id} not found in buffers map")
 
-        del self._mediated_buffers[mediated_id]
+        removed = self._mediated_buffers.pop(mediated_id)
+
+        # Only the buffer that defined the maximum end can lower it
+        if removed._start + removed._length == self._max_end:
+            self._max_end = self._scan_max_end()
+
+        self._resize_source_if_needed()
+
+    def _range_changed(self, old_end: int, new_end: int):
+        """Update the maximum end after a mediated buffer changed its range.
+
+        Args:
+            old_end: Previous start + length of the mediated buffer
+            new_end: New start + length of the mediated buffer
+        """
+        if new_end >= self._max_end:
+            self._max_end = new_end
+        elif old_end == self._max_end:
+            # The buffer that defined the maximum shrank
+            self._max_end = self._scan_max_end()
+        else:
+            return
 
         self._resize_source_if_needed()
 
+    def _scan_max_end(self) -> int:
+        """Find the maximum end position needed by all consumers."""
+        return max((buf._start + buf._length for buf in self._mediated_buffers.values()), default=0)
+
     def _resize_source_if_needed(self):
         """Resize source buffer based on largest consumer request."""
         if not self._mediated_buffers:
             return
 
-        # Find the maximum end position needed by all consumers
-        max_end = max(buf._start + buf._length for buf in self._mediated_buffers.values())
-
         # Resize source buffer to accommodate all consumers
-        self._backend.set_range(start=0, length=max_end)
+        self._backend.set_range(start=0, length=self._max_end)
 
     # Buffer ABC methods (delegate to source)
     def lock(self):
@@ -518,6 +793,14 @@ class AudioBufferMediator(Object):
         """
         return self._backend.data
 
+    def snapshot(self) -> Optional[np.ndarray]:
+        """Get a copy of the full source data (see AudioBuffer.snapshot)."""
+        return self._backend.snapshot()
+
+    def snapshot_into(self, dst: np.ndarray, start: int = 0, length: Optional[int] = None) -> int:
+        """Copy a range of the source data into dst (see AudioBuffer.snapshot_into)."""
+        return self._backend.snapshot_into(dst, start, length)
+
 
 class DynamicAudioBufferMediator(AudioBufferMediator):
     """Mediator for dynamic buffers (e.g., ring buffers from ALSA/JACK)."""
@@ -543,7 +826,7 @@ class DynamicAudioBufferMediator(AudioBufferMediator):
         if not res:
             Result.error(f"DynamicAudioBufferMediator: open: failed to create MediatedAudioBuffer", res)
         mediated_buffer = res.unwrapped
-        self._mediated_buffers[mediated_buffer.uid] = mediated_buffer
+        self._add_mediated_buffer(mediated_buffer)
 
         # Activate source buffer on first mediated buffer
         if not self._mediated_buffers or len(self._mediated_buffers) == 1:
@@ -568,7 +851,14 @@ class StaticAudioBuffer(AudioBuffer):
     Abstraction to model static buffers, for instance the in memory
     representation of a file.
     """
-    pass
+
+    def snapshot(self) -> Optional[np.ndarray]:
+        """Data is immutable after load, so the view itself is a valid snapshot."""
+        return self.data
+
+    @property
+    def is_static(self) -> bool:
+        return True
 
 
 class FileAudioBuffer(StaticAudioBuffer):
@@ -578,20 +868,26 @@ class FileAudioBuffer(StaticAudioBuffer):
     Providers create separate FileBuffer instance for each channel.
     """
 
-    def __init__(self, file_path: str, data: np.ndarray, sample_rate: int):
+    def __init__(self, file_path: str, data: np.ndarray, sample_rate: int, *,
+                 take_ownership: bool = False):
         """Initialize file buffer for ONE channel.
 
         Args:
             file_path: Path to the audio file
             data: Numpy array of samples (1D array for single channel)
             sample_rate: Sample rate in Hz
+            take_ownership: If True, keep data itself (copied only if not contiguous)
+                instead of a copy; the caller must not modify it afterwards
         """
         self._file_path = file_path
         self._sample_rate = sample_rate
         self._num_samples = len(data)
 
         # Single channel buffer
-        self._buffer = data.copy()
+        if take_ownership:
+            self._buffer = np.ascontiguousarray(data)
+        else:
+            self._buffer = data.copy()
 
         # Active by default
         self._active = True
@@ -679,7 +975,7 @@ class StaticAudioBufferMediator(AudioBufferMediator):
         if not res:
             return Result.error("StaticAudioBufferMediator: open: could not create MediatedStaticAudioBuffer", res)
         mediated_buffer = res.unwrapped
-        self._mediated_buffers[mediated_buffer.uid] = mediated_buffer
+        self._add_mediated_buffer(mediated_buffer)
 
         return Ok(mediated_buffer)
     
@@ -4,6 +4,9 @@ from ymery.result import Result, Ok
 from typing import List, Dict, Union, Any
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import threading
 
 class Buffer(Object):
     pass
@@ -120,38 +123,100 @@ class AudioDeviceManager(DeviceManager):
 class TreeLikeCache(ABC):
     """
     Cache for the assetprovider browsing interface with TTL support
+
+    With stale_while_revalidate, entries outliving the TTL are kept for one more
+    TTL period: they are still returned, while a background thread refetches them.
+    Past that, the cache is dropped and refetched synchronously as usual.
+
+    Paths must be DataPath instances, they are not checked on these per-frame lookups.
     """
-    def __init__(self, ttl: float = 10.0):
+    def __init__(self, ttl: float = 10.0, stale_while_revalidate: bool = False):
         self._children = {}
         self._metadata = {}
+        self._metadata_keys = {}  # Keys of cached metadata, as Results
+        self._stale_children = {}  # Previous TTL period, served while revalidating
+        self._stale_metadata = {}
         self._ttl = ttl  # Time-to-live in seconds
-        self._cache_timestamp = None  # When cache was last populated
+        self._expires_at = 0.0  # Monotonic time the cache expires at, 0.0 while empty
+        self._hard_expires_at = 0.0  # Past this, stale entries are not served either
+        self._stale_while_revalidate = stale_while_revalidate and ttl is not None
+        self._refresh_lock = threading.Lock()
+        self._refresh_executor = None  # Created on first background refresh
+        self._inflight = set()  # (cache name, path) being refreshed
+        self._generation = 0  # Bumped on invalidation, drops refreshes started before it
         import time
         self._time = time  # Store time module for testing
 
     def _is_cache_expired(self) -> bool:
         """Check if cache has expired based on TTL"""
-        if self._cache_timestamp is None:
-            return True
+        # Monotonic, so wall clock adjustments neither expire nor extend the cache
+        return self._time.monotonic() >= self._expires_at
+
+    def _start_ttl(self):
+        """Compute the expiry time once, when the first entry is cached"""
         if self._ttl is None:
-            return False
-        elapsed = self._time.time() - self._cache_timestamp
-        return elapsed >= self._ttl
+            self._expires_at = float("inf")
+        else:
+            self._expires_at = self._time.monotonic() + self._ttl
+            self._hard_expires_at = self._expires_at + self._ttl
+
+    def _expire(self):
+        """Drop the expired cache, or demote it to stale entries while revalidating"""
+        if not self._stale_while_revalidate or not self._expires_at or self._time.monotonic() >= self._hard_expires_at:
+            self.invalidate_cache()
+            return
+        with self._refresh_lock:
+            self._stale_children = self._children
+            self._stale_metadata = self._metadata
+            self._children = {}
+            self._metadata = {}
+            self._metadata_keys = {}
+        self._start_ttl()
+
+    def _schedule_refresh(self, cache_name: str, path: DataPath, fetch):
+        """Refetch a stale entry on the background thread, once per path"""
+        key = (cache_name, path)
+        with self._refresh_lock:
+            if key in self._inflight:
+                return
+            self._inflight.add(key)
+            generation = self._generation
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tree-like-cache")
+            self._refresh_executor.submit(self._refresh, cache_name, path, fetch, generation)
+
+    def _refresh(self, cache_name: str, path: DataPath, fetch, generation: int):
+        try:
+            res = fetch(path)
+        except Exception as e:
+            # Cached like any other error, so callers see it instead of the stale entry
+            logging.warning(f"TreeLikeCache: background refresh of {path} failed: {e}")
+            res = Result.error(f"TreeLikeCache: background refresh of {path} failed: {e}")
+        with self._refresh_lock:
+            self._inflight.discard((cache_name, path))
+            if generation != self._generation:
+                return
+            getattr(self, cache_name)[path] = res
+            if cache_name == "_metadata":
+                self._metadata_keys.pop(path, None)
 
     def get_children_names(self, path: DataPath) -> Result[List[str]]:
-        assert isinstance(path, DataPath)
         # Check TTL and invalidate if expired
         if self._is_cache_expired():
-            self.invalidate_cache()
+            self._expire()
 
         res = self._children.get(path)
+        if res is None and self._stale_children:
+            res = self._stale_children.get(path)
+            if res is not None:
+                self._schedule_refresh("_children", path, self.get_children_names_uncached)
         if res is None:
             res = self.get_children_names_uncached(path)
             # Cache the Result (both Ok and Err)
             self._children[path] = res
-            # Update timestamp on first cache entry
-            if self._cache_timestamp is None:
-                self._cache_timestamp = self._time.time()
+            # Start the TTL on first cache entry
+            if not self._expires_at:
+                self._start_ttl()
             if not res:
                 return Result.error(f"TreeLikeCache: could not retrive children for {path}", res)
             return res
@@ -161,19 +226,22 @@ class TreeLikeCache(ABC):
         return res
 
     def get_metadata(self, path: DataPath) -> Result[Dict]:
-        assert isinstance(path, DataPath)
         # Check TTL and invalidate if expired
         if self._is_cache_expired():
-            self.invalidate_cache()
+            self._expire()
 
         res = self._metadata.get(path)
+        if res is None and self._stale_metadata:
+            res = self._stale_metadata.get(path)
+            if res is not None:
+                self._schedule_refresh("_metadata", path, self.get_metadata_uncached)
         if res is None:
             res = self.get_metadata_uncached(path)
             # Cache the Result (both Ok and Err)
             self._metadata[path] = res
-            # Update timestamp on first cache entry
-            if self._cache_timestamp is None:
-                self._cache_timestamp = self._time.time()
+            # Start the TTL on first cache entry
+            if not self._expires_at:
+                self._start_ttl()
             if not res:
                 return Result.error(f"TreeLikeCache: could not retrieve metadata for {path}", res)
             return res
@@ -182,58 +250,53 @@ class TreeLikeCache(ABC):
             return Result.error(f"TreeLikeCache: cached error for {path}", res)
         return res
 
-    def get_metadata_keys(self, path: DataPath) -> Result[list]:
-        """Get metadata keys by retrieving full metadata and extracting keys"""
-        assert isinstance(path, DataPath)
-        # Check if metadata is already cached
-        cached_metadata = self._metadata.get(path)
-        if cached_metadata is not None:
-            # Metadata already retrieved
-            if not cached_metadata:
-                return Result.error(f"TreeLikeCache: cached error for {path}", cached_metadata)
-            metadata = cached_metadata.unwrapped
-            if isinstance(metadata, dict):
-                return Ok(list(metadata.keys()))
-            return Result.error(f"TreeLikeCache: metadata is not a dict at {path}")
+    def get_metadata_keys(self, path: DataPath) -> Result[tuple]:
+        """Get metadata keys by retrieving full metadata and extracting keys, as a cached tuple"""
+        # Keys are cached with the metadata, which only changes on invalidation
+        keys = self._metadata_keys.get(path)
+        if keys is not None:
+            return keys
 
-        # Not cached - retrieve full metadata
-        res = self.get_metadata(path)
+        res = self._resolve_metadata(path)
         if not res:
-            return Result.error(f"TreeLikeCache: could not retrieve metadata for {path}", res)
-        metadata = res.unwrapped
-        if isinstance(metadata, dict):
-            return Ok(list(metadata.keys()))
-        return Result.error(f"TreeLikeCache: metadata is not a dict at {path}")
+            return res
+        return self._cache_metadata_keys(path, res)
+
+    def _cache_metadata_keys(self, path: DataPath, cached: Result[Dict]) -> Result[tuple]:
+        """Extract the keys of cached metadata once, later calls return the same tuple"""
+        keys = Ok(tuple(cached.unwrapped.keys()))
+        with self._refresh_lock:
+            # Stale metadata, or metadata replaced by a background refresh meanwhile, must not pin its keys
+            if self._metadata.get(path) is cached:
+                self._metadata_keys[path] = keys
+        return keys
+
+    def _resolve_metadata(self, path: DataPath) -> Result[Dict]:
+        """Return the cached metadata Result for path, retrieving it if needed, checked to hold a dict"""
+        cached = self._metadata.get(path)
+        if cached is None:
+            # Not cached - retrieve full metadata
+            cached = self.get_metadata(path)
+            if not cached:
+                return Result.error(f"TreeLikeCache: could not retrieve metadata for {path}", cached)
+        elif not cached:
+            return Result.error(f"TreeLikeCache: cached error for {path}", cached)
+        if not isinstance(cached.unwrapped, dict):
+            return Result.error(f"TreeLikeCache: metadata is not a dict at {path}")
+        return cached
 
     def get(self, path: DataPath) -> Result[Any]:
         """Get metadata value - last component of path is the key"""
-        assert isinstance(path, DataPath)
         node_path = path.dirname()
         key = path.filename()
 
-        # Check if metadata is already cached
-        cached_metadata = self._metadata.get(node_path)
-        if cached_metadata is not None:
-            # Metadata already retrieved
-            if not cached_metadata:
-                return Result.error(f"TreeLikeCache: cached error for {node_path}", cached_metadata)
-            metadata = cached_metadata.unwrapped
-            if isinstance(metadata, dict):
-                if key in metadata:
-                    return Ok(metadata[key])
-                return Result.error(f"TreeLikeCache: key '{key}' not found in metadata at {node_path}")
-            return Result.error(f"TreeLikeCache: metadata is not a dict at {node_path}")
-
-        # Not cached - retrieve full metadata
-        res = self.get_metadata(node_path)
+        res = self._resolve_metadata(node_path)
         if not res:
-            return Result.error(f"TreeLikeCache: could not retrieve metadata for {node_path}", res)
+            return res
         metadata = res.unwrapped
-        if isinstance(metadata, dict):
-            if key in metadata:
-                return Ok(metadata[key])
-            return Result.error(f"TreeLikeCache: key '{key}' not found in metadata at {node_path}")
-        return Result.error(f"TreeLikeCache: metadata is not a dict at {node_path}")
+        if key in metadata:
+            return Ok(metadata[key])
+        return Result.error(f"TreeLikeCache: key '{key}' not found in metadata at {node_path}")
 
     def set(self, path: DataPath, value: Any) -> Result[None]:
         """Set not implemented for cache"""
@@ -241,9 +304,20 @@ class TreeLikeCache(ABC):
 
     def invalidate_cache(self):
         """Invalidate the entire cache - to be called when data changes"""
-        self._children.clear()
-        self._metadata.clear()
-        self._cache_timestamp = None
+        with self._refresh_lock:
+            self._children.clear()
+            self._metadata.clear()
+            self._metadata_keys.clear()
+            self._stale_children = {}
+            self._stale_metadata = {}
+            self._inflight.clear()
+            self._generation += 1
+            executor = self._refresh_executor
+            self._refresh_executor = None
+        self._expires_at = 0.0
+        if executor is not None:
+            # Pending refreshes are obsolete, a running one is discarded by the generation check
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def erase_cache(self):
         """Deprecated: use invalidate_cache() instead"""
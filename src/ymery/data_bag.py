@@ -494,8 +494,12 @@ class DataBag(Object):
                 # Relative path - DataPath handles ..
                 new_path = self._main_data_path / data_path
 
-        # Copy data_trees so child can add local trees without affecting parent
-        child_data_trees = self._data_trees.copy()
+        # Only a 'data' section makes the child add local trees (in init), copy the
+        # parent's trees then so it does not affect the parent, share them otherwise
+        if isinstance(static, dict) and "data" in static:
+            child_data_trees = self._data_trees.copy()
+        else:
+            child_data_trees = self._data_trees
         return DataBag.create(self._dispatcher, self._plugin_manager, child_data_trees, new_key, new_path, static)
 
     @classmethod
@@ -14,7 +14,9 @@ class Dispatcher(Object):
     """
     def __init__(self):
         self._action_handlers = {}  # target-id -> handler
-        self._event_handlers = {}  # source or source/name -> list of handlers
+        self._action_handler_fns = {}  # target-id -> bound handle_action, used by dispatch_action
+        self._event_handlers = {}  # source or source/name -> {handler: None} (ordered set)
+        self._specific_sources = {}  # possible source of a source/name key -> number of such keys
 
     # ========== Action Handler Methods ==========
 
@@ -25,6 +27,7 @@ class Dispatcher(Object):
             handler: Handler object implementing handle_action() method (must have uid attribute)
         """
         self._action_handlers[handler.uid] = handler
+        self._action_handler_fns[handler.uid] = handler.handle_action
         return Ok(None)
 
     def unregister_action_handler(self, handler_id: str) -> Result[None]:
@@ -33,8 +36,8 @@ class Dispatcher(Object):
         Args:
             handler_id: ID of the handler to unregister
         """
-        if handler_id in self._action_handlers:
-            del self._action_handlers[handler_id]
+        self._action_handlers.pop(handler_id, None)
+        self._action_handler_fns.pop(handler_id, None)
         return Ok(None)
 
     # ========== Event Handler Methods ==========
@@ -46,10 +49,11 @@ class Dispatcher(Object):
             key: Either "source" or "source/name" (e.g., "asset-tree" or "asset-tree/tree-node-clicked")
             handler: Handler object implementing handle_event() method
         """
-        if key not in self._event_handlers:
-            self._event_handlers[key] = []
-        if handler not in self._event_handlers[key]:
-            self._event_handlers[key].append(handler)
+        handlers = self._event_handlers.get(key)
+        if handlers is None:
+            handlers = self._event_handlers[key] = {}
+            self._count_specific_sources(key, 1)
+        handlers[handler] = None
 
         return Ok(None)
 
@@ -60,13 +64,30 @@ class Dispatcher(Object):
             key: The source or source/name key
             handler: Handler to unregister
         """
-        if key in self._event_handlers:
-            if handler in self._event_handlers[key]:
-                self._event_handlers[key].remove(handler)
-            if not self._event_handlers[key]:
+        handlers = self._event_handlers.get(key)
+        if handlers is not None:
+            handlers.pop(handler, None)
+            if not handlers:
                 del self._event_handlers[key]
+                self._count_specific_sources(key, -1)
         return Ok(None)
 
+    def _count_specific_sources(self, key: str, delta: int):
+        """Track which sources have source/name handlers, so dispatch can skip building their keys
+
+        Sources may contain "/" themselves, so every prefix ending before a "/" is counted.
+        """
+        counts = self._specific_sources
+        index = key.find("/")
+        while index != -1:
+            source = key[:index]
+            count = counts.get(source, 0) + delta
+            if count:
+                counts[source] = count
+            else:
+                del counts[source]
+            index = key.find("/", index + 1)
+
     # ========== Dispatch Methods ==========
 
     def dispatch_action(self, action: dict):
@@ -80,13 +101,10 @@ class Dispatcher(Object):
         Returns:
             Result from handler (True for success, Error/False for failure, or None)
         """
-        action_name = action.get("action")
-        target_id = action.get("target-id")
-
         # Target handler is mandatory for actions
-        if target_id and target_id in self._action_handlers:
-            result = self._action_handlers[target_id].handle_action(action)
-            return result
+        handle_action = self._action_handler_fns.get(action.get("target-id"))
+        if handle_action is not None:
+            return handle_action(action)
 
         return None
 
@@ -108,23 +126,45 @@ class Dispatcher(Object):
         if not source or not name:
             return Ok(None)
 
+        event_handlers = self._event_handlers
+        has_specific = source in self._specific_sources
+        if not has_specific and source not in event_handlers:
+            return Ok(None)
 
         # Route to specific source/name handlers
-        key_specific = f"{source}/{name}"
-        if key_specific in self._event_handlers:
-            for handler in self._event_handlers[key_specific]:
+        handlers = event_handlers.get(f"{source}/{name}") if has_specific else None
+        if handlers:
+            # Iterate a copy: a handler may (un)register handlers for the same key
+            for handler in tuple(handlers):
                 res = handler.handle_event(event)
                 if not res:
                     return Result.error("event handler error", res)
         # Route to source-wide handlers
-        if source in self._event_handlers:
-            for handler in self._event_handlers[source]:
+        handlers = event_handlers.get(source)
+        if handlers:
+            for handler in tuple(handlers):
                 res = handler.handle_event(event)
                 if not res:
                     return Result.error("event handler handling not successfull", res)
 
         return Ok(None)
 
+    def dispatch_events(self, events: list) -> Result[None]:
+        """Dispatch a burst of events, in order
+
+        Equivalent to calling dispatch_event() for each event: every event reaches its
+        "source/name" handlers, then its "source" handlers, before the next event is routed.
+        Stops at the first handler error.
+        """
+        if not self._event_handlers:
+            return Ok(None)
+        dispatch_event = self.dispatch_event
+        for event in events:
+            res = dispatch_event(event)
+            if not res:
+                return res
+        return Ok(None)
+
 
     def init(self) -> Result[None]:
         return Ok(None)
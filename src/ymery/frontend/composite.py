@@ -10,12 +10,56 @@ from ymery.result import Result, Ok
 from typing import List
 
 
+def _substitute_str(spec, key, value):
+    if "$" not in spec:
+        return spec
+    # Substitute $key and $value in string
+    return spec.replace("$key", key).replace("$value", value)
+
+
+def _substitute_dict(spec, key, value):
+    # Recursively substitute in dict values
+    return {k: _substitute(v, key, value) for k, v in spec.items()}
+
+
+def _substitute_list(spec, key, value):
+    # Recursively substitute in list items
+    return [_substitute(item, key, value) for item in spec]
+
+
+# Exact type -> substitution, one dict lookup per node instead of up to three isinstance calls
+_SUBSTITUTE_BY_TYPE = {
+    str: _substitute_str,
+    dict: _substitute_dict,
+    list: _substitute_list,
+}
+
+
+def _substitute(spec, key: str, value: str):
+    """Substitute already stringified key and value, see Composite._substitute_variables"""
+    substitute = _SUBSTITUTE_BY_TYPE.get(type(spec))
+    if substitute is not None:
+        return substitute(spec, key, value)
+    # Subclasses take the isinstance path, primitives (int, float, bool, None) are returned as-is
+    if isinstance(spec, str):
+        return _substitute_str(spec, key, value)
+    if isinstance(spec, dict):
+        return _substitute_dict(spec, key, value)
+    if isinstance(spec, list):
+        return _substitute_list(spec, key, value)
+    return spec
+
+
 @widget
 class Composite(Widget):
     """Composite widget - contains list of child widgets"""
 
     def init(self) -> Result[None]:
         self._child_groups = {}
+        self._children_flat = []
+        self._children_dirty = False
+        self._plans = []  # Parsed body items, see _compile_body
+        self._plans_body = None  # Body object the plans were compiled from
 
         res = super().init()
         if not res:
@@ -27,16 +71,17 @@ class Composite(Widget):
             return Result.error("Composite.init: failed to get body", res)
         body = res.unwrapped
 
-        # Normalize body to list
         if body is None:
             return Ok(None)
-        if isinstance(body, (str, dict)):
-            body = [body]
-        elif not isinstance(body, list):
-            return Result.error(f"Composite.init: body must be string, dict, or list, got {type(body)}")
+        # Normalize and parse the body once, _ensure_children reuses the plans while the body is unchanged
+        res = self._compile_body(body)
+        if not res:
+            return Result.error("Composite.init: invalid body", res)
+        self._plans = res.unwrapped
+        self._plans_body = body
 
         # Initialize empty dict for each body item index
-        self._child_groups = {i: {} for i in range(len(body))}
+        self._child_groups = {i: {} for i in range(len(self._plans))}
         return Ok(None)
 
 
@@ -47,11 +92,7 @@ class Composite(Widget):
         res = self._ensure_children()
         if not res:
             return Result.error("could not init children", res)
-        # Check if all groups are empty
-        for group in self._child_groups.values():
-            if len(group) > 0:
-                return Ok(False)
-        return Ok(True)
+        return Ok(not self._children_flat)
 
     @property
     def children(self) -> Result[List]:
@@ -59,10 +100,7 @@ class Composite(Widget):
         res = self._ensure_children()
         if not res:
             return Result.error("could not init children")
-        result = []
-        for group in self._child_groups.values():
-            result.extend(group.values())
-        return Ok(result)
+        return Ok(list(self._children_flat))
 
     def _substitute_variables(self, spec, key, value):
         """
@@ -76,41 +114,35 @@ class Composite(Widget):
         Returns:
             Substituted spec (same type as input)
         """
-        if isinstance(spec, str):
-            # Substitute $key and $value in string
-            result = spec.replace("$key", str(key))
-            result = result.replace("$value", str(value))
-            return result
-        elif isinstance(spec, dict):
-            # Recursively substitute in dict values
-            return {k: self._substitute_variables(v, key, value) for k, v in spec.items()}
-        elif isinstance(spec, list):
-            # Recursively substitute in list items
-            return [self._substitute_variables(item, key, value) for item in spec]
-        else:
-            # Primitives (int, float, bool, None) - return as-is
-            return spec
+        return _substitute(spec, str(key), str(value))
 
-    def _ensure_children(self) -> Result[None]:
-        """Sync child widgets with data - creates new, reuses existing, garbage collects removed"""
-        res = self._data_bag.get_static("body")
-        if not res:
-            self._handle_error(Result.error("Composite: _ensure_children: failed to get body", res))
-            return Ok(None)
-        body = res.unwrapped
-        if body is None:
-            return Ok(None)
+    def _spec_needs_substitution(self, spec) -> bool:
+        """Check whether a widget spec contains $key or $value anywhere"""
+        if isinstance(spec, str):
+            return "$key" in spec or "$value" in spec
+        if isinstance(spec, dict):
+            return any(self._spec_needs_substitution(v) for v in spec.values())
+        if isinstance(spec, list):
+            return any(self._spec_needs_substitution(item) for item in spec)
+        return False
+
+    def _compile_body(self, body) -> Result[list]:
+        """
+        Parse body items once into (kind, spec, needs_substitution) plans.
 
+        kind is "foreach-key-value", "foreach-key", "foreach-child", "single",
+        or "invalid" with the error Result as spec. For "foreach-child", spec
+        is the (base spec, widget key, widget statics) template children get
+        their data-path added to.
+        """
         # Normalize body to list
         if isinstance(body, (str, dict)):
             body = [body]
         elif not isinstance(body, list):
-            self._handle_error(Result.error(f"Composite body must be string, dict, or list, got {type(body)}"))
-            return Ok(None)
-
-        for i, item in enumerate(body):
-            old_group = self._child_groups.get(i, {})
+            return Result.error(f"Composite body must be string, dict, or list, got {type(body)}")
 
+        plans = []
+        for item in body:
             # foreach-key-value (also support foreach-key for compatibility)
             foreach_key = None
             if isinstance(item, dict):
@@ -118,22 +150,71 @@ class Composite(Widget):
                     foreach_key = "foreach-key-value"
                 elif "foreach-key" in item:
                     foreach_key = "foreach-key"
+                elif "foreach-child" in item:
+                    foreach_key = "foreach-child"
 
-            if foreach_key:
-                if len(item) != 1:
-                    self._handle_error(Result.error(f"Composite {foreach_key} item must have only '{foreach_key}' key, got {list(item.keys())}"))
+            if foreach_key is None:
+                plans.append(("single", item, False))
+                continue
+            if len(item) != 1:
+                plans.append(("invalid", Result.error(f"Composite {foreach_key} item must have only '{foreach_key}' key, got {list(item.keys())}"), False))
+                continue
+
+            foreach_body = item[foreach_key]
+            widget_spec = foreach_body[0] if isinstance(foreach_body, list) else foreach_body
+            if foreach_key == "foreach-child":
+                if not isinstance(widget_spec, dict):
+                    plans.append((foreach_key, ({}, widget_spec, {}), False))
+                    continue
+                if not widget_spec:
+                    plans.append(("invalid", Result.error("Composite foreach-child widget spec is empty"), False))
                     continue
+                # data-path goes into the statics of the first key
+                wkey = next(iter(widget_spec))
+                statics = widget_spec[wkey]
+                plans.append((foreach_key, (widget_spec, wkey, statics if isinstance(statics, dict) else {}), False))
+                continue
+            plans.append((foreach_key, widget_spec, self._spec_needs_substitution(widget_spec)))
+        return Ok(plans)
+
+    def _ensure_children(self) -> Result[None]:
+        """Sync child widgets with data - creates new, reuses existing, garbage collects removed"""
+        res = self._data_bag.get_static("body")
+        if not res:
+            self._handle_error(Result.error("Composite: _ensure_children: failed to get body", res))
+            return Ok(None)
+        body = res.unwrapped
+        if body is None:
+            return Ok(None)
 
-                foreach_body = item[foreach_key]
-                widget_spec = foreach_body[0] if isinstance(foreach_body, list) else foreach_body
+        # The body is static, so it is only parsed again when a different object is returned
+        if body is not self._plans_body:
+            res = self._compile_body(body)
+            if not res:
+                self._handle_error(res)
+                return Ok(None)
+            self._plans = res.unwrapped
+            self._plans_body = body
+
+        for i, (kind, spec, needs_substitution) in enumerate(self._plans):
+            old_group = self._child_groups.get(i, {})
+
+            if kind == "invalid":
+                # Built once with the plan, instead of formatting and capturing a stack every frame
+                self._handle_error(spec)
+                continue
 
+            if kind == "foreach-key-value" or kind == "foreach-key":
                 metadata_res = self._data_bag.get_metadata()
                 if not metadata_res:
-                    self._handle_error(Result.error(f"Composite: {foreach_key} failed to get metadata", metadata_res))
+                    self._handle_error(Result.error(f"Composite: {kind} failed to get metadata", metadata_res))
                     continue
                 metadata = metadata_res.unwrapped
                 if not isinstance(metadata, dict):
-                    self._handle_error(Result.error(f"Composite: {foreach_key} requires metadata to be dict, got {type(metadata)}"))
+                    self._handle_error(Result.error(f"Composite: {kind} requires metadata to be dict, got {type(metadata)}"))
+                    continue
+                # Same keys in the same order: every widget is reused as is
+                if len(old_group) == len(metadata) and all(a == b for a, b in zip(old_group, metadata, strict=True)):
                     continue
 
                 new_group = {}
@@ -141,55 +222,42 @@ class Composite(Widget):
                     if key in old_group:
                         new_group[key] = old_group[key]
                     else:
-                        value = metadata[key]
-                        substituted_spec = self._substitute_variables(widget_spec, key, value)
+                        if needs_substitution:
+                            substituted_spec = self._substitute_variables(spec, key, metadata[key])
+                        else:
+                            substituted_spec = spec
                         res = self._widget_factory.create_widget(self._data_bag, substituted_spec, self._namespace)
                         if res:
                             new_group[key] = res.unwrapped
                         else:
-                            self._handle_error(Result.error(f"Composite: {foreach_key} failed to create widget for key '{key}'", res))
-                self._child_groups[i] = new_group
+                            self._handle_error(Result.error(f"Composite: {kind} failed to create widget for key '{key}'", res))
+                self._set_group(i, old_group, new_group)
                 continue
 
             # foreach-child: rebuild dict with data children
-            if isinstance(item, dict) and "foreach-child" in item:
-                if len(item) != 1:
-                    self._handle_error(Result.error(f"Composite foreach-child item must have only 'foreach-child' key, got {list(item.keys())}"))
-                    continue
-
-                foreach_body = item["foreach-child"]
-                widget_spec = foreach_body[0] if isinstance(foreach_body, list) else foreach_body
-
+            if kind == "foreach-child":
                 res = self._data_bag.get_children_names()
                 if not res:
                     self._handle_error(Result.error(f"Composite: foreach-child failed to get children", res))
                     continue
                 child_names = res.unwrapped
+                if len(old_group) == len(child_names) and all(a == b for a, b in zip(old_group, child_names, strict=True)):
+                    continue
 
                 new_group = {}
                 for child_name in child_names:
                     if child_name in old_group:
                         new_group[child_name] = old_group[child_name]
                     else:
-                        # Add data-path to widget_spec for child navigation
-                        if isinstance(widget_spec, dict):
-                            child_spec = dict(widget_spec)
-                            # Find the widget key and add data-path to its statics
-                            for wkey in child_spec:
-                                if isinstance(child_spec[wkey], dict):
-                                    child_spec[wkey] = dict(child_spec[wkey])
-                                    child_spec[wkey]["data-path"] = child_name
-                                else:
-                                    child_spec[wkey] = {"data-path": child_name}
-                                break
-                        else:
-                            child_spec = {widget_spec: {"data-path": child_name}}
+                        # Add data-path to the widget statics for child navigation
+                        base, wkey, statics = spec
+                        child_spec = {**base, wkey: {**statics, "data-path": child_name}}
                         res = self._widget_factory.create_widget(self._data_bag, child_spec, self._namespace)
                         if res:
                             new_group[child_name] = res.unwrapped
                         else:
                             self._handle_error(Result.error(f"Composite: foreach-child failed to create widget for '{child_name}'", res))
-                self._child_groups[i] = new_group
+                self._set_group(i, old_group, new_group)
                 continue
 
             # Single widget: create if not exists
@@ -197,7 +265,7 @@ class Composite(Widget):
                 continue
 
             # Factory handles all parsing - just pass the item directly
-            res = self._widget_factory.create_widget(self._data_bag, item, self._namespace)
+            res = self._widget_factory.create_widget(self._data_bag, spec, self._namespace)
             if not res:
                 self._handle_error(Result.error(f"Composite: failed to create child widget", res))
                 continue
@@ -207,10 +275,20 @@ class Composite(Widget):
                 self._handle_error(Result.error(f"Popup cannot be child of Composite"))
                 continue
 
-            self._child_groups[i] = {"_single": child}
+            self._set_group(i, old_group, {"_single": child})
 
+        if self._children_dirty:
+            self._children_flat = [child for group in self._child_groups.values() for child in group.values()]
+            self._children_dirty = False
         return Ok(None)
 
+    def _set_group(self, index, old_group, new_group):
+        """Store a reconciled group, marking the flat children list stale if it changed"""
+        self._child_groups[index] = new_group
+        # Surviving keys keep their widget, so the same key order means the same children
+        if len(new_group) != len(old_group) or not all(a == b for a, b in zip(new_group, old_group, strict=True)):
+            self._children_dirty = True
+
     def render(self) -> Result[None]:
         """Render all children - Composite doesn't use head/body pattern"""
         # Check if data children changed (for foreach-child refresh)
@@ -222,11 +300,10 @@ class Composite(Widget):
         if not res:
             self._handle_error(Result.error("Composite: _push_styles failed", res))
 
-        for _, child_group in self._child_groups.items():
-            for _, child in child_group.items():
-                res = child.render()
-                if not res:
-                    self._handle_error(Result.error(f"Composite: child render failed", res))
+        for child in self._children_flat:
+            res = child.render()
+            if not res:
+                self._handle_error(Result.error(f"Composite: child render failed", res))
 
         # Pop styles after rendering children
         res = self._pop_styles()
@@ -239,5 +316,7 @@ class Composite(Widget):
     def dispose(self) -> Result[None]:
         """Dispose all children"""
         self._child_groups = {}
+        self._children_flat = []
+        self._children_dirty = False
         return Ok(None)
 
@@ -6,14 +6,21 @@ from ymery.result import Result, Ok
 from ymery.plugin_manager import PluginManager
 import importlib.util
 import sys
+from functools import lru_cache
 
 from typing import Optional, Dict
 
 
+# Keys of dict statics that are NOT the widget name
+_SPECIAL_KEYS = frozenset({"data-path"})
+
+
+@lru_cache(maxsize=1024)
 def to_pascal_case(name: str) -> str:
     """Convert hyphenated name to PascalCase (e.g., 'same-line' -> 'SameLine')"""
     return ''.join(part.capitalize() for part in name.split('-'))
 
+@lru_cache(maxsize=1024)
 def to_kebab_case(name: str) -> str:
     """Convert PascalCase to kebab-case (e.g., 'SameLine' -> 'same-line')"""
     result = []
@@ -43,6 +50,7 @@ e
         self._dispatcher = dispatcher
         self._plugin_manager = plugin_manager
         self._widget_cache = {}  # Cache of primitive + YAML widget definitions
+        self._resolved_widgets = {}  # (namespace, widget name) -> see _resolve_widget
         self._widgets_path = widgets_path
         self._data_trees = data_trees or {}
 
@@ -65,9 +73,49 @@ e
         # Populate widget_cache from widget_definitions (YAML definitions)
         for widget_name, widget_def in self._widget_definitions.items():
             self._widget_cache[widget_name] = widget_def
+        self._resolved_widgets.clear()
 
         return Ok(None)
 
+    def _resolve_widget(self, widget_name: str, namespace: str) -> Result[tuple]:
+        """
+        Resolve a widget name used in namespace to
+        (widget class, YAML definition or None, widget namespace, qualified name).
+
+        Qualified names fall back to their last segment (for primitives).
+        """
+        # Add namespace if not qualified
+        if namespace and '.' not in widget_name:
+            widget_name = f"{namespace}.{widget_name}"
+
+        # Extract namespace from widget_name if present
+        widget_namespace = widget_name.rsplit('.', 1)[0] if '.' in widget_name else None
+
+        # Smart lookup: try with full name first, then without namespace (for primitives)
+        cached_item = self._widget_cache.get(widget_name)
+        if cached_item is None and widget_namespace is not None:
+            cached_item = self._widget_cache.get(widget_name.split('.')[-1])
+
+        if cached_item is None:
+            return Result.error(f"Widget '{widget_name}' not found in cache")
+
+        if widget_namespace is None:
+            widget_namespace = namespace
+
+        if isinstance(cached_item, type):
+            return Ok((cached_item, None, widget_namespace, widget_name))
+        if isinstance(cached_item, dict) and "type" in cached_item:
+            # YAML widget definition, merged with the statics at creation
+            widget_type = cached_item["type"]
+            if widget_type not in self._widget_cache:
+                return Result.error(f"Widget type '{widget_type}' not found in cache")
+
+            widget_class = self._widget_cache[widget_type]
+            if not isinstance(widget_class, type):
+                return Result.error(f"Widget type '{widget_type}' is not a class")
+            return Ok((widget_class, cached_item, widget_namespace, widget_name))
+        return Result.error(f"WidgetFactory: cached_item must be a class or dict with 'type', got {type(cached_item)}")
+
     def create_widget(self, parent_data_bag: Optional[DataBag], statics, namespace: str = "") -> Result["Widget"]:
         """
         Create a widget by REFERENCE to a named widget.
@@ -128,7 +176,7 @@ e
         1. Parses statics to extract widget_name and widget_statics dict
         2. Extracts data-path from statics
         3. Calls parent_data_bag.inherit(data_path, statics) to create child DataBag
-           - inherit() copies _data_trees dict (isolation between siblings)
+           - inherit() copies _data_trees dict when statics add local data (isolation between siblings)
            - inherit() calls DataBag.create() which calls init()
            - init() processes statics['data'] to add local trees
            - init() processes statics['main-data'] to override main data
@@ -144,13 +192,16 @@ e
         elif isinstance(statics, dict):
             # Dict → {widget_name: widget_statics} with optional data-path
             # data-path is a special key that's NOT the widget name
-            special_keys = {"data-path"}
-            widget_keys = [k for k in statics.keys() if k not in special_keys]
+            if len(statics) == 1 and "data-path" not in statics:
+                # Common case {widget_name: widget_statics}, nothing to filter
+                widget_name = next(iter(statics))
+            else:
+                widget_keys = [k for k in statics if k not in _SPECIAL_KEYS]
 
-            if len(widget_keys) != 1:
-                return Result.error(f"create_widget: dict must have exactly one widget key (plus optional data-path), got {len(widget_keys)}: {widget_keys}")
+                if len(widget_keys) != 1:
+                    return Result.error(f"create_widget: dict must have exactly one widget key (plus optional data-path), got {len(widget_keys)}: {widget_keys}")
 
-            widget_name = widget_keys[0]
+                widget_name = widget_keys[0]
             widget_statics = statics[widget_name]
 
             # Ensure widget_statics is a dict or None
@@ -161,10 +212,9 @@ e
             # Copy data-path into widget_statics if present
             if "data-path" in statics:
                 if widget_statics is None:
-                    widget_statics = {}
+                    widget_statics = {"data-path": statics["data-path"]}
                 else:
-                    widget_statics = dict(widget_statics)  # Don't mutate original
-                widget_statics["data-path"] = statics["data-path"]
+                    widget_statics = {**widget_statics, "data-path": statics["data-path"]}  # Don't mutate original
         elif isinstance(statics, list):
             # List → composite body
             widget_name = "composite"
@@ -172,59 +222,30 @@ e
         else:
             return Result.error(f"create_widget: invalid statics type: {type(statics)}")
 
-        # Add namespace if not qualified
-        if '.' not in widget_name and namespace:
-            widget_name = f"{namespace}.{widget_name}"
-
-        # Extract namespace from widget_name if present
-        if '.' in widget_name:
-            widget_namespace = widget_name.rsplit('.', 1)[0]
-            lookup_name = widget_name
-        else:
-            widget_namespace = namespace
-            lookup_name = widget_name
-
-        # Smart lookup: try with full name first, then without namespace (for primitives)
-        cached_item = None
-        if lookup_name in self._widget_cache:
-            cached_item = self._widget_cache[lookup_name]
-        elif '.' in lookup_name:
-            widget_only = lookup_name.split('.')[-1]
-            if widget_only in self._widget_cache:
-                cached_item = self._widget_cache[widget_only]
-                lookup_name = widget_only
-
-        if cached_item is None:
-            return Result.error(f"Widget '{widget_name}' not found in cache")
+        # Resolved once per (namespace, name), the widget cache only changes in init().
+        # The tuple key hashes the long-lived name strings, no qualified name is built per call
+        resolved = self._resolved_widgets.get((namespace, widget_name))
+        if resolved is None:
+            res = self._resolve_widget(widget_name, namespace)
+            if not res:
+                return res
+            resolved = self._resolved_widgets[(namespace, widget_name)] = res.unwrapped
+        widget_class, widget_definition, widget_namespace, widget_name = resolved
 
-        # Determine widget class and merge YAML definition with statics BEFORE creating DataBag
+        # Merge YAML definition with statics BEFORE creating DataBag
         # This ensures data: and main-data: from YAML definitions are processed by DataBag.init()
-        if isinstance(cached_item, type):
-            widget_class = cached_item
+        if widget_definition is None:
             merged_statics = widget_statics
-        elif isinstance(cached_item, dict) and "type" in cached_item:
-            # YAML widget definition - merge with statics BEFORE DataBag creation
-            widget_type = cached_item["type"]
-            if widget_type not in self._widget_cache:
-                return Result.error(f"Widget type '{widget_type}' not found in cache")
-
-            widget_class = self._widget_cache[widget_type]
-            if not isinstance(widget_class, type):
-                return Result.error(f"Widget type '{widget_type}' is not a class")
-
-            # Merge: YAML definition as base, widget_statics (caller) overrides
-            merged_statics = dict(cached_item)
-            if widget_statics:
-                merged_statics.update(widget_statics)
         else:
-            return Result.error(f"WidgetFactory: cached_item must be a class or dict with 'type', got {type(cached_item)}")
+            # Merge: YAML definition as base, widget_statics (caller) overrides
+            merged_statics = {**widget_definition, **widget_statics} if widget_statics else dict(widget_definition)
 
         # Extract data-path from merged statics
         data_path = merged_statics.get("data-path") if merged_statics else None
 
         # Create DataBag with merged statics (includes data: from YAML definition)
         if parent_data_bag is not None:
-            # Normal case: inherit from parent (handles data:, main-data:, copies _data_trees)
+            # Normal case: inherit from parent (handles data:, main-data:, copies _data_trees if needed)
             res = parent_data_bag.inherit(data_path, merged_statics)
             if not res:
                 return Result.error(f"create_widget: failed to inherit DataBag for '{widget_name}'", res)
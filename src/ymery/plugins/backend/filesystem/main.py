@@ -54,7 +54,7 @@ class FilesystemManager(TreeLikeCache, AudioDeviceManager):
     }
 
     def __init__(self, dispatcher, plugin_manager, raw_arg=None):
-        TreeLikeCache.__init__(self)
+        TreeLikeCache.__init__(self, stale_while_revalidate=True)
         AudioDeviceManager.__init__(self)
         self._dispatcher = dispatcher
         self._plugin_manager = plugin_manager
@@ -73,6 +73,8 @@ class FilesystemManager(TreeLikeCache, AudioDeviceManager):
             # SoundfileProvider doesn't need explicit cleanup, but we could add dispose() if needed
             pass
         self._soundfile_devices.clear()
+        # Also stops the background refresh thread
+        self.invalidate_cache()
         return Ok(None)
 
     def _parse_mounts(self):
@@ -25,7 +25,8 @@ class SoundfileBuffer(FileAudioBuffer):
     One buffer per channel - SoundfileProvider creates multiple instances.
     """
 
-    def __init__(self, file_path: str, channel_data: np.ndarray, sample_rate: int, channel_id: str, full_load: bool = True):
+    def __init__(self, file_path: str, channel_data: np.ndarray, sample_rate: int, channel_id: str, full_load: bool = True,
+                 take_ownership: bool = False):
         """Initialize soundfile buffer for a single channel.
 
         Args:
@@ -34,13 +35,15 @@ class SoundfileBuffer(FileAudioBuffer):
             sample_rate: Sample rate in Hz
             channel_id: Channel ID string (for identification)
             full_load: If True, keep full buffer; if False, allow dynamic range loading
+            take_ownership: If True, keep channel_data itself instead of a copy
         """
         self._sf_file_path = file_path
         self._channel_id = channel_id
         self._full_load = full_load
 
         # Initialize parent with single-channel data
-        super().__init__(file_path=file_path, data=channel_data, sample_rate=sample_rate)
+        super().__init__(file_path=file_path, data=channel_data, sample_rate=sample_rate,
+                         take_ownership=take_ownership)
 
     def init(self) -> Result[None]:
         pass
@@ -106,7 +109,9 @@ class SoundfileDevice(AudioDevice):
                 channel_data=self._channel_data[channel_path],
                 sample_rate=self._sr,
                 channel_id=str(channel_path),
-                full_load=self._full_load
+                full_load=self._full_load,
+                # Freshly extracted and only read from here on, no need for another copy
+                take_ownership=True
             )
 
             # Create mediator for this channel
@@ -1,49 +1,149 @@
 """Waveform Generator - Generates standard waveforms (sine, square, triangle) with ring buffer"""
 import threading
+import logging
+import math
+import os
+import sys
 import numpy as np
 import time
+from fractions import Fraction
 
 from ymery.backend.types import AudioDeviceManager, AudioDevice
 from ymery.types import DataPath
-from ymery.backend.audio_buffer import DynamicAudioRingBuffer, DynamicAudioBufferMediator, MediatedAudioBuffer
+from ymery.backend.audio_buffer import DynamicAudioRingBuffer, DynamicAudioBufferMediator, MediatedAudioBuffer, aligned_empty
 from ymery.result import Result, Ok
 
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Union, Optional
 from ymery.decorators import device_manager, device
 
+_WAVEFORMS = ("sine", "square", "triangle")
+
+# Constant sets for hashed membership tests on path components
+_WAVEFORMS_SET = frozenset(_WAVEFORMS)
+_BRANCHES = frozenset(("available", "opened"))
+
+# Metadata type/category values, interned once so every metadata dict shares the same string objects
+_TYPE_WAVEFORM_DEVICE = sys.intern("waveform-device")
+_TYPE_WAVEFORM_MANAGER = sys.intern("waveform-manager")
+_TYPE_AUDIO_CHANNEL = sys.intern("audio-channel")
+_TYPE_FOLDER = sys.intern("folder")
+_CATEGORY_AUDIO_DEVICE = sys.intern("audio-device")
+_CATEGORY_AUDIO_DEVICE_MANAGER = sys.intern("audio-device-manager")
+
+# Upper bound for the per-device lookup table (one exact repetition of the waveform)
+_MAX_LUT_SAMPLES = 65536
+
+# float32 scalars, so that the in-place ufuncs on float32 buffers never mix in float64
+_ONE = np.float32(1.0)
+_TWO = np.float32(2.0)
+_FOUR = np.float32(4.0)
+_HALF = np.float32(0.5)
+_TWO_PI = np.float32(2.0 * np.pi)
+_INV_TWO_PI = 1.0 / (2.0 * np.pi)
+
+# Sample formats the ring buffer can hold, generation always runs in float32
+_SAMPLE_FORMATS = {"float32": np.float32, "int16": np.int16}
+
+# Full scale of int16 PCM output, samples in [-1, 1] map to [-32767, 32767]
+_INT16_SCALE = np.float32(32767.0)
+
+# SCHED_FIFO priority of the generation thread when realtime scheduling is requested
+_REALTIME_PRIORITY = 20
+
+# Generation falling further behind real time than this is resynchronized instead of caught up
+_MAX_CATCH_UP_SECONDS = 1.0
+
+
+def _evaluate_waveform(waveform_type: str, phase: np.ndarray) -> np.ndarray:
+    """Evaluate a waveform at the given phases (radians)"""
+    if waveform_type == "sine":
+        return np.sin(phase)
+    cycles = np.remainder(phase / (2.0 * np.pi), 1.0)
+    if waveform_type == "square":
+        # High for the first half of the cycle, low for the second
+        return np.where(cycles < 0.5, 1.0, -1.0)
+    # Triangle wave: 2 * abs(2 * x - 1) - 1 over the fractional cycle x
+    return 2.0 * np.abs(2.0 * cycles - 1.0) - 1.0
+
 
 @device
-class WaveformDevice(AudioDevice, threading.Thread):
+class WaveformDevice(AudioDevice):
     """Generates waveform data in a ring buffer"""
 
-    def __init__(self, waveform_type: str, sample_rate: int = 48000, frequency: float = 440.0, period_size: int = 1024):
+    def __init__(self, waveform_type: str, sample_rate: int = 48000, frequency: float = 440.0, period_size: int = 1024,
+                 batch_periods: int = 1, realtime: bool = False, cpu: Optional[int] = None,
+                 sample_format: str = "float32"):
         """
         Args:
             waveform_type: Type of waveform ("sine", "square", "triangle")
             sample_rate: Sample rate in Hz
             frequency: Waveform frequency in Hz
             period_size: Number of samples to generate per period
+            batch_periods: Number of periods generated and written per wake-up
+            realtime: Run the generation thread with SCHED_FIFO priority (Linux, needs CAP_SYS_NICE)
+            cpu: Pin the generation thread to this CPU core (Linux)
+            sample_format: Format of the ring buffer samples ("float32" or "int16" PCM)
         """
         AudioDevice.__init__(self)
-        threading.Thread.__init__(self)
-        self.daemon = True  # Thread will exit when main program exits
+        self._thread = None  # Generation thread, created by start()
+        self._stop_event = threading.Event()  # Wakes the generation loop on stop()
 
         self._waveform_type = waveform_type
         self._sample_rate = sample_rate
         self._frequency = frequency
         self._period_size = period_size
+        self._batch_periods = max(1, batch_periods)
+        self._batch_size = period_size * self._batch_periods
+        self._realtime = realtime
+        self._cpu = cpu
+        self._sample_format = sample_format
+        self._format = _SAMPLE_FORMATS.get(sample_format)
         self._buffer_mediator = None
-        self._phase = 0.0  # Current phase for continuous waveform generation
-        self._sample_buffer = np.zeros(period_size, dtype=np.float32)  # Preallocated buffer
+        self._phase = np.float32(0.0)  # Current phase for continuous waveform generation
+        phase_increment = 2.0 * np.pi * frequency / sample_rate
+        # Phase advance per period, wrapped in float64 before narrowing to keep it exact
+        self._period_phase_increment = np.float32((period_size * phase_increment) % (2.0 * np.pi))
+        # Float samples of a batch before they are quantized into the ring buffer, only
+        # needed for int16; cache line aligned so vectorized ufunc loops do not split cache lines
+        self._sample_buffer = None
+        if self._format is np.int16:
+            self._sample_buffer = aligned_empty(self._batch_size, np.float32)
+
+        # Rotation ramps for sine: sin(phase + k*w) = sin(k*w)*cos(phase) + cos(k*w)*sin(phase)
+        # They are computed once, so a period costs two scalar sin/cos instead of period_size of them
+        ramp = np.arange(period_size, dtype=np.float64) * phase_increment
+        self._cycle_ramp = (ramp * _INV_TWO_PI).astype(np.float32)  # Per-sample phase offsets in cycles
+        self._sin_ramp = np.sin(ramp).astype(np.float32)
+        self._cos_ramp = np.cos(ramp).astype(np.float32)
+        self._scratch_buffer = aligned_empty(period_size, np.float32)
+
+        # Per-period generator, resolved once as the waveform type is fixed for the device lifetime
+        self._generate_period = {
+            "sine": self._generate_sine,
+            "square": self._generate_square,
+            "triangle": self._generate_triangle,
+        }.get(waveform_type)
+
+        # When the waveform repeats exactly after a short number of samples, periods are
+        # copied from a precomputed table instead of being generated
+        self._lut = None
+        self._lut_length = 0
+        self._lut_offset = 0
+        self._build_lut()
 
     def init(self) -> Result[None]:
         """Initialize ring buffer and mediator"""
+        if self._generate_period is None:
+            return Result.error(f"WaveformDevice: unknown waveform type '{self._waveform_type}'")
+        if self._format is None:
+            return Result.error(f"WaveformDevice: unsupported sample format '{self._sample_format}'")
+
         # Create single-channel ring buffer
         res = DynamicAudioRingBuffer.create(
             sample_rate=self._sample_rate,
             initial_size=0,  # Lazy allocation
-            period_size=self._period_size,
-            format_type=np.float32
+            period_size=self._batch_size,  # Writes are whole batches
+            format_type=self._format
         )
         if not res:
             return Result.error(f"WaveformDevice: failed to create DynamicRingBuffer")
@@ -77,55 +177,161 @@ class WaveformDevice(AudioDevice, threading.Thread):
         self.stop()
         return Ok(None)
 
-    def _generate_waveform(self):
-        """Generate waveform samples directly into preallocated buffer."""
-        # Calculate phase increment per sample
-        phase_increment = 2.0 * np.pi * self._frequency / self._sample_rate
-
-        # Generate phase values - multiply operation writes directly to buffer
-        np.multiply(np.arange(self._period_size, dtype=np.float32), phase_increment, out=self._sample_buffer)
-        np.add(self._sample_buffer, self._phase, out=self._sample_buffer)
-
-        # Update phase for next call (keep in [0, 2π] range)
-        self._phase = (self._phase + self._period_size * phase_increment) % (2.0 * np.pi)
-
-        # Generate waveform based on type, writing directly to buffer
-        if self._waveform_type == "sine":
-            np.sin(self._sample_buffer, out=self._sample_buffer)
-        elif self._waveform_type == "square":
-            np.sin(self._sample_buffer, out=self._sample_buffer)
-            np.sign(self._sample_buffer, out=self._sample_buffer)
-        elif self._waveform_type == "triangle":
-            # Triangle wave: -1 to 1
-            # Normalize phase to [0, 1] and take fractional part
-            np.divide(self._sample_buffer, 2.0 * np.pi, out=self._sample_buffer)
-            np.remainder(self._sample_buffer, 1.0, out=self._sample_buffer)
-            # Convert to triangle: 2 * abs(2 * x - 1) - 1
-            np.multiply(self._sample_buffer, 2.0, out=self._sample_buffer)
-            np.subtract(self._sample_buffer, 1.0, out=self._sample_buffer)
-            np.abs(self._sample_buffer, out=self._sample_buffer)
-            np.multiply(self._sample_buffer, 2.0, out=self._sample_buffer)
-            np.subtract(self._sample_buffer, 1.0, out=self._sample_buffer)
-
-    def run(self):
-        while True:
-            #print("WaveformDevice: run")
-            """Generate waveform data continuously"""
-            # Generate one period of samples (writes to self._sample_buffer)
-            self._generate_waveform()
-
-            # Write to ring buffer
-            self._buffer_mediator.backend.write(self._sample_buffer)
-
-            # Sleep to simulate real-time (period duration)
-            sleep_time = self._period_size / self._sample_rate
-            time.sleep(sleep_time)
+    def _build_lut(self):
+        """Precompute one exact repetition of the waveform, if it is short enough.
 
+        With sample_rate / frequency = p / q, q cycles of the waveform span exactly p samples,
+        so the signal repeats every p samples. The table holds p + batch size samples, so that
+        any batch can be copied with a single contiguous slice.
+        """
+        frequency = Fraction(self._frequency).limit_denominator(1000)
+        if frequency <= 0:
+            return
+        # Only frequencies that are such a fraction up to float precision (e.g. 440.1), others
+        # (e.g. 440.0001) would be rounded to a different pitch, generate them per period
+        if abs(float(frequency) - self._frequency) > 1e-12 * self._frequency:
+            return
+        ratio = Fraction(self._sample_rate) / frequency
+        repeat_length, cycles = ratio.numerator, ratio.denominator
+        if repeat_length > _MAX_LUT_SAMPLES:
+            return
+
+        # Reduce the phase exactly in integers before scaling to radians
+        indices = np.arange(repeat_length + self._batch_size, dtype=np.int64)
+        phase = (indices * cycles % repeat_length) * (2.0 * np.pi / repeat_length)
+        lut = _evaluate_waveform(self._waveform_type, phase)
+        if self._format is np.int16:
+            lut *= _INT16_SCALE
+        # Stored in the output format, so copying a batch needs no conversion
+        self._lut = lut.astype(self._format)
+        self._lut_length = repeat_length
+
+    def _rotate(self, out: np.ndarray, phase: float):
+        """Fill out with sin(phase + k*w) by rotating the precomputed ramps."""
+        np.multiply(self._sin_ramp, math.cos(phase), out=out)
+        np.multiply(self._cos_ramp, math.sin(phase), out=self._scratch_buffer)
+        np.add(out, self._scratch_buffer, out=out)
+
+    def _generate_waveform(self, out: np.ndarray):
+        """Generate waveform samples directly into out.
+
+        Args:
+            out: Array in the sample format, a whole number of periods (at most one batch) long
+        """
+        if self._lut is not None:
+            n = len(out)
+            start = self._lut_offset
+            np.copyto(out, self._lut[start:start + n])
+            self._lut_offset = (start + n) % self._lut_length
+            return
+
+        quantize = out.dtype != np.float32
+        target = self._sample_buffer[:len(out)] if quantize else out
+        for start in range(0, len(out), self._period_size):
+            self._generate_period(target[start:start + self._period_size])
+        if quantize:
+            # Samples are within [-1, 1], so scaling and casting in one pass cannot overflow
+            np.multiply(target, _INT16_SCALE, out=out, casting="unsafe")
+
+    def _next_phase(self) -> np.float32:
+        """Return the phase at the start of the period and advance it by one period"""
+        phase = self._phase
+        # Keep in [0, 2π] range
+        self._phase = (phase + self._period_phase_increment) % _TWO_PI
+        return phase
+
+    def _fill_cycles(self, out: np.ndarray):
+        """Fill out with the fractional phase of each sample of the period, in cycles [0, 1)"""
+        # Phase in cycles rather than radians, so no division is needed to normalize it
+        np.add(self._cycle_ramp, np.float32(self._next_phase() * _INV_TWO_PI), out=out)
+        # x - floor(x) vectorizes better than np.modf or np.remainder
+        np.floor(out, out=self._scratch_buffer)
+        np.subtract(out, self._scratch_buffer, out=out)
+
+    def _generate_sine(self, out: np.ndarray):
+        """Generate one period of sine wave into out"""
+        self._rotate(out, self._next_phase())
+
+    def _generate_square(self, out: np.ndarray):
+        """Generate one period of square wave into out"""
+        # The sign only depends on which half of the cycle the phase is in, no sine needed
+        self._fill_cycles(out)
+        np.subtract(_HALF, out, out=out)
+        np.copysign(_ONE, out, out=out)
+
+    def _generate_triangle(self, out: np.ndarray):
+        """Generate one period of triangle wave into out"""
+        # Triangle wave: -1 to 1
+        self._fill_cycles(out)
+        # Convert to triangle: 2 * abs(2 * x - 1) - 1 == abs(4 * x - 2) - 1
+        np.multiply(out, _FOUR, out=out)
+        np.subtract(out, _TWO, out=out)
+        np.abs(out, out=out)
+        np.subtract(out, _ONE, out=out)
+
+    def _enter_realtime(self):
+        """Pin the calling thread to the configured core and raise it to SCHED_FIFO.
+
+        Best effort: both calls are Linux only and SCHED_FIFO needs CAP_SYS_NICE (or an
+        rtprio limit), on failure the thread keeps running with the default policy.
+        """
+        try:
+            if self._cpu is not None:
+                os.sched_setaffinity(0, {self._cpu})
+            if self._realtime:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(_REALTIME_PRIORITY))
+        except (AttributeError, OSError) as e:
+            logging.warning(f"WaveformDevice: could not apply thread scheduling settings: {e}")
+
+    def start(self):
+        """Start waveform generation in a worker thread (restartable after stop)"""
+        if self.is_alive():
+            return
+        self._stop_event.clear()
+        # Daemon thread, exits when main program exits
+        self._thread = threading.Thread(target=self._run_loop, name=self.uid, daemon=True)
+        self._thread.start()
+
+    def is_alive(self) -> bool:
+        """Check if the generation thread is running"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run_loop(self):
+        """Generate waveform data continuously"""
+        if self._realtime or self._cpu is not None:
+            self._enter_realtime()
+
+        batch_duration = self._batch_size / self._sample_rate
+        # Periods are scheduled against absolute deadlines, so wake-up jitter does not accumulate
+        deadline = time.monotonic()
+        ring_buffer = self._buffer_mediator.backend
+        while not self._stop_event.is_set():
+            # Generate one batch of periods straight into the ring buffer storage
+            remaining = self._batch_size
+            while remaining > 0:
+                slot = ring_buffer.reserve(remaining)
+                if slot is None:
+                    # Nobody is reading, the samples would be dropped anyway
+                    break
+                self._generate_waveform(slot)
+                ring_buffer.commit(len(slot))
+                remaining -= len(slot)
+
+            deadline += batch_duration
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                # Interruptible wait, stop() does not have to wait for the batch to elapse
+                self._stop_event.wait(delay)
+            elif delay < -_MAX_CATCH_UP_SECONDS:
+                # Stalled for too long (suspend, debugger), resynchronize instead of bursting
+                deadline = time.monotonic()
 
     def stop(self):
         """Stop waveform generation"""
-        if self.is_alive():
-            self.join(timeout=1.0)
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None and thread.is_alive() and threading.current_thread() is not thread:
+            thread.join(timeout=1.0)
 
     def get_children_names(self, path: DataPath) -> Result[List[str]]:
         """Get children for browsing.
@@ -156,8 +362,8 @@ class WaveformDevice(AudioDevice, threading.Thread):
             meta = {
                 "uid": self.uid,
                 "label": f"{self._waveform_type.capitalize()} ({self._frequency}Hz)",
-                "type": "waveform-device",
-                "category": "audio-device",
+                "type": _TYPE_WAVEFORM_DEVICE,
+                "category": _CATEGORY_AUDIO_DEVICE,
                 "status": "running" if self.is_alive() else "stopped",
                 "capabilities": {
                     "openable": False,
@@ -170,7 +376,10 @@ class WaveformDevice(AudioDevice, threading.Thread):
                     "waveform-type": self._waveform_type,
                     "frequency": self._frequency,
                     "sample-rate": self._sample_rate,
-                    "period-size": self._period_size
+                    "period-size": self._period_size,
+                    "batch-periods": self._batch_periods,
+                    "realtime": self._realtime,
+                    "sample-format": self._sample_format
                 }
             }
             # Add buffer mediator as instance
@@ -220,7 +429,7 @@ class WaveformDevice(AudioDevice, threading.Thread):
 class WaveformManager(AudioDeviceManager):
     """Manager for waveform generators"""
 
-    WAVEFORMS = ["sine", "square", "triangle"]
+    WAVEFORMS = list(_WAVEFORMS)
 
     def __init__(self, dispatcher, plugin_manager, raw_arg=None):
         super().__init__()
@@ -229,6 +438,27 @@ class WaveformManager(AudioDeviceManager):
         self._raw_arg = raw_arg
         self._waveform_devices = {}  # Track opened WaveformDevice instances
 
+        # Metadata of the static part of the tree, built once and shared by all lookups
+        self._root_metadata = {
+            "uid": self.uid,
+            "name": "waveform",
+            "label": "Waveform Generator",
+            "type": _TYPE_WAVEFORM_MANAGER,
+            "category": _CATEGORY_AUDIO_DEVICE_MANAGER,
+            "description": "Generates standard waveforms (sine, square, triangle)"
+        }
+        self._folder_metadata = {
+            branch: {
+                "name": branch,
+                "label": branch.capitalize(),
+                "type": _TYPE_FOLDER,
+                "category": _TYPE_FOLDER
+            }
+            for branch in _BRANCHES
+        }
+        self._available_metadata = {w: self._build_available_metadata(w) for w in self.WAVEFORMS}
+        self._channel_metadata = {w: self._build_channel_metadata(w) for w in self.WAVEFORMS}
+
     def init(self) -> Result[None]:
         """Initialize waveform manager"""
         return Ok(None)
@@ -258,7 +488,7 @@ class WaveformManager(AudioDeviceManager):
             return Ok(["available", "opened"])
 
         # Handle /available and /opened branches
-        if len(path) > 0 and path[0] in ["available", "opened"]:
+        if len(path) > 0 and path[0] in _BRANCHES:
             branch = path[0]
             subpath = path[1:]  # Strip branch prefix
 
@@ -276,7 +506,7 @@ class WaveformManager(AudioDeviceManager):
             return Ok(self.WAVEFORMS)
 
         # Individual waveform: "/sine", "/square", "/triangle" -> return "0" (single channel)
-        if len(path) == 1 and path[0] in self.WAVEFORMS:
+        if len(path) == 1 and path[0] in _WAVEFORMS_SET:
             return Ok(["0"])
 
         return Ok([])
@@ -290,7 +520,7 @@ class WaveformManager(AudioDeviceManager):
             return Ok([])
 
         # "/sine", "/square", etc. -> delegate to device
-        if len(path) >= 1 and path[0] in self.WAVEFORMS:
+        if len(path) >= 1 and path[0] in _WAVEFORMS_SET:
             device_path = DataPath("/" + path[0])
             device = self._waveform_devices.get(device_path)
             if not device:
@@ -313,26 +543,14 @@ class WaveformManager(AudioDeviceManager):
         """
         # Root
         if len(path) == 0 or str(path) == "/":
-            return Ok({
-                "uid": self.uid,
-                "name": "waveform",
-                "label": "Waveform Generator",
-                "type": "waveform-manager",
-                "category": "audio-device-manager",
-                "description": "Generates standard waveforms (sine, square, triangle)"
-            })
+            return Ok(self._root_metadata)
 
         # /available or /opened folder
-        if len(path) == 1 and path[0] in ["available", "opened"]:
-            return Ok({
-                "name": path[0],
-                "label": path[0].capitalize(),
-                "type": "folder",
-                "category": "folder"
-            })
+        if len(path) == 1 and path[0] in _BRANCHES:
+            return Ok(self._folder_metadata[path[0]])
 
         # Handle /available and /opened branches
-        if len(path) > 0 and path[0] in ["available", "opened"]:
+        if len(path) > 0 and path[0] in _BRANCHES:
             branch = path[0]
             subpath = path[1:]  # Strip branch prefix
 
@@ -346,71 +564,104 @@ class WaveformManager(AudioDeviceManager):
     def _get_metadata_available(self, path: DataPath) -> Result[Dict]:
         """Get metadata for /available branch"""
         # Individual waveform endpoint: "/sine", "/square", "/triangle"
-        if len(path) == 1 and path[0] in self.WAVEFORMS:
-            waveform_type = path[0]
-            return Ok({
-                "name": waveform_type,
-                "label": f"{waveform_type.capitalize()} Wave",
-                "type": "waveform-device",
-                "category": "audio-device",
-                "description": f"{waveform_type.capitalize()} waveform generator",
-                "capabilities": {
-                    "openable": True,
-                    "readable": True,
-                    "writable": False
-                },
-                "details": {
-                    "waveform-type": waveform_type
-                },
-                "config-schema": {
-                    "frequency": {
-                        "type": "float",
-                        "default": 440.0,
-                        "min": 20.0,
-                        "max": 20000.0,
-                        "label": "Frequency (Hz)"
-                    },
-                    "sample-rate": {
-                        "type": "int",
-                        "default": 48000,
-                        "choices": [44100, 48000, 96000],
-                        "label": "Sample Rate"
-                    },
-                    "period-size": {
-                        "type": "int",
-                        "default": 1024,
-                        "min": 128,
-                        "max": 8192,
-                        "label": "Period Size"
-                    }
-                }
-            })
+        if len(path) == 1 and path[0] in _WAVEFORMS_SET:
+            return Ok(self._available_metadata[path[0]])
 
         # Channel path: "/sine/0", "/square/0", "/triangle/0" - hardcoded, no device created
-        if len(path) == 2 and path[0] in self.WAVEFORMS and path[1] == "0":
-            waveform_type = path[0]
-            return Ok({
-                "name": "0",
-                "label": "Channel 0",
-                "type": "audio-channel",
-                "category": "audio-channel",
-                "capabilities": {
-                    "openable": True,
-                    "readable": True,
-                    "writable": False
-                },
-                "details": {
-                    "channel-id": 0,
-                    "waveform-type": waveform_type
-                }
-            })
+        if len(path) == 2 and path[0] in _WAVEFORMS_SET and path[1] == "0":
+            return Ok(self._channel_metadata[path[0]])
 
         return Result.error(f"WaveformManager: unknown available path {path}")
 
+    @staticmethod
+    def _build_available_metadata(waveform_type: str) -> Dict:
+        """Build the metadata of an available waveform endpoint"""
+        return {
+            "name": waveform_type,
+            "label": f"{waveform_type.capitalize()} Wave",
+            "type": _TYPE_WAVEFORM_DEVICE,
+            "category": _CATEGORY_AUDIO_DEVICE,
+            "description": f"{waveform_type.capitalize()} waveform generator",
+            "capabilities": {
+                "openable": True,
+                "readable": True,
+                "writable": False
+            },
+            "details": {
+                "waveform-type": waveform_type
+            },
+            "config-schema": {
+                "frequency": {
+                    "type": "float",
+                    "default": 440.0,
+                    "min": 20.0,
+                    "max": 20000.0,
+                    "label": "Frequency (Hz)"
+                },
+                "sample-rate": {
+                    "type": "int",
+                    "default": 48000,
+                    "choices": [44100, 48000, 96000],
+                    "label": "Sample Rate"
+                },
+                "period-size": {
+                    "type": "int",
+                    "default": 1024,
+                    "min": 128,
+                    "max": 8192,
+                    "label": "Period Size"
+                },
+                "batch-periods": {
+                    "type": "int",
+                    "default": 1,
+                    "min": 1,
+                    "max": 64,
+                    "label": "Periods per Wake-up"
+                },
+                "realtime": {
+                    "type": "bool",
+                    "default": False,
+                    "label": "Realtime Scheduling"
+                },
+                "cpu": {
+                    "type": "int",
+                    "required": False,
+                    "min": 0,
+                    "label": "CPU Core",
+                    "description": "Core to pin the generation thread to, unpinned when not set"
+                },
+                "sample-format": {
+                    "type": "str",
+                    "default": "float32",
+                    "choices": ["float32", "int16"],
+                    "label": "Sample Format"
+                }
+            }
+        }
+
+    @staticmethod
+    def _build_channel_metadata(waveform_type: str) -> Dict:
+        """Build the metadata of the single channel of an available waveform"""
+        return {
+            "name": "0",
+            "label": "Channel 0",
+            "type": _TYPE_AUDIO_CHANNEL,
+            "category": _TYPE_AUDIO_CHANNEL,
+            "capabilities": {
+                "openable": True,
+                "readable": True,
+                "writable": False
+            },
+            "details": {
+                "channel-id": 0,
+                "waveform-type": waveform_type
+            }
+        }
+
     def _get_metadata_opened(self, path: DataPath) -> Result[Dict]:
         """Get metadata for /opened branch - delegates to devices"""
         # Individual opened waveform: "/sine", "/square", "/triangle"
-        if len(path) == 1 and path[0] in self.WAVEFORMS:
+        if len(path) == 1 and path[0] in _WAVEFORMS_SET:
             device_path = DataPath("/" + path[0])
             device = self._waveform_devices.get(device_path)
             if not device:
@@ -420,7 +671,7 @@ class WaveformManager(AudioDeviceManager):
             return device.get_metadata(DataPath("/"))
 
         # Deeper paths - delegate to device
-        if len(path) >= 2 and path[0] in self.WAVEFORMS:
+        if len(path) >= 2 and path[0] in _WAVEFORMS_SET:
             device_path = DataPath("/" + path[0])
             device = self._waveform_devices.get(device_path)
             if not device:
@@ -443,7 +694,7 @@ class WaveformManager(AudioDeviceManager):
             Result containing MediatedBuffer
         """
         # Path should be "/available/waveform_type/0" (channel path)
-        if len(path) != 3 or path[0] != "available" or path[1] not in self.WAVEFORMS or path[2] != "0":
+        if len(path) != 3 or path[0] != "available" or path[1] not in _WAVEFORMS_SET or path[2] != "0":
             return Result.error(f"WaveformManager: invalid channel path {path}, expected /available/waveform_type/0")
 
         waveform_type = path[1]
@@ -455,13 +706,21 @@ class WaveformManager(AudioDeviceManager):
             frequency = config.get("frequency", 440.0)
             sample_rate = config.get("sample_rate", 48000)
             period_size = config.get("period_size", 1024)
+            batch_periods = config.get("batch_periods", 1)
+            realtime = config.get("realtime", False)
+            cpu = config.get("cpu")
+            sample_format = config.get("sample_format", "float32")
 
             # Create device using create pattern
             res = WaveformDevice.create(
                 waveform_type=waveform_type,
                 sample_rate=sample_rate,
                 frequency=frequency,
-                period_size=period_size
+                period_size=period_size,
+                batch_periods=batch_periods,
+                realtime=realtime,
+                cpu=cpu,
+                sample_format=sample_format
             )
             if not res:
                 return Result.error(f"WaveformManager: failed to create {waveform_type} device", res)
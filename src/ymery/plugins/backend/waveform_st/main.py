@@ -1,4 +1,6 @@
 """Waveform Generator (Single-Threaded) - For Pyodide/WebAssembly environments"""
+import cmath
+import sys
 import numpy as np
 import time
 
@@ -10,6 +12,35 @@ from ymery.result import Result, Ok
 from typing import List, Dict, Any, Union, Callable, Optional
 from ymery.decorators import device_manager, device
 
+_WAVEFORMS = ("sine", "square", "triangle")
+
+# Constant sets for hashed membership tests on path components
+_WAVEFORMS_SET = frozenset(_WAVEFORMS)
+_BRANCHES = frozenset(("available", "opened"))
+
+# Slot of each waveform in the manager's list of opened devices
+_WAVEFORM_INDEX = {w: i for i, w in enumerate(_WAVEFORMS)}
+
+# Metadata type/category values, interned once so every metadata dict shares the same string objects
+_TYPE_WAVEFORM_DEVICE = sys.intern("waveform-device-st")
+_TYPE_WAVEFORM_MANAGER = sys.intern("waveform-manager-st")
+_TYPE_AUDIO_CHANNEL = sys.intern("audio-channel")
+_TYPE_FOLDER = sys.intern("folder")
+_CATEGORY_AUDIO_DEVICE = sys.intern("audio-device")
+_CATEGORY_AUDIO_DEVICE_MANAGER = sys.intern("audio-device-manager")
+
+# Sample formats the ring buffer can hold, generation always runs in float32
+_SAMPLE_FORMATS = {"float32": np.float32, "int16": np.int16}
+
+# Full scale of int16 PCM output, samples in [-1, 1] map to [-32767, 32767]
+_INT16_SCALE = np.float32(32767.0)
+
+# Square/triangle phase accumulator: the full uint32 range is one cycle, so wrapping is the overflow
+_PHASE_SCALE = 2 ** 32
+# Scale of the signed phase to 4 * cycles, for the triangle
+_TRIANGLE_SCALE = np.float32(4.0 / _PHASE_SCALE)
+_ONE = np.float32(1.0)
+
 
 class OnDemandAudioRingBuffer(DynamicAudioRingBuffer):
     """
@@ -22,7 +53,8 @@ class OnDemandAudioRingBuffer(DynamicAudioRingBuffer):
 
     def __init__(self, sample_rate: int, initial_size: int = 0,
                  period_size: Optional[int] = None, format_type: type = np.float32,
-                 generator: Optional[Callable[[], np.ndarray]] = None):
+                 generator: Optional[Callable[[], np.ndarray]] = None,
+                 generator_into: Optional[Callable[[np.ndarray], None]] = None):
         """Initialize on-demand ring buffer.
 
         Args:
@@ -31,17 +63,29 @@ class OnDemandAudioRingBuffer(DynamicAudioRingBuffer):
             period_size: Period size for rounding (optional)
             format_type: Numpy data type for samples
             generator: Callable that returns period_size samples when called
+            generator_into: Optional callable that fills the given array, whose length is a
+                multiple of period_size, in place; preferred over generator when set
         """
         super().__init__(sample_rate, initial_size, period_size, format_type)
         self._generator = generator
-        self._start_time: Optional[float] = None
+        self._generator_into = generator_into
+        self._start_ns: Optional[int] = None
         self._samples_generated: int = 0
+        self._next_update_ns: int = 0  # Clock time at which the next period is due
         self._running: bool = False
 
+        # View returned by data, reused until a write or resize moves the useful region
+        self._view: Optional[np.ndarray] = None
+        self._view_buffer: Optional[np.ndarray] = None
+        self._view_ptr: int = -1
+        self._view_wrapped: bool = False
+        self._view_size: int = -1
+
     def start(self):
         """Start the virtual clock for on-demand generation."""
-        self._start_time = time.time()
+        self._start_ns = time.monotonic_ns()
         self._samples_generated = 0
+        self._schedule_next_update()
         self._running = True
 
     def stop(self):
@@ -62,29 +106,97 @@ class OnDemandAudioRingBuffer(DynamicAudioRingBuffer):
 
     def _update(self):
         """Generate missing samples based on elapsed time."""
-        if not self._running or self._start_time is None or self._generator is None:
+        if not self._running or self._start_ns is None:
             return
+        # Polled again before another full period is due, nothing to generate
+        now_ns = time.monotonic_ns()
+        if now_ns < self._next_update_ns:
+            return
+        if self._generator is None and self._generator_into is None:
+            return
+
+        # Expected samples from the elapsed time, in integer nanoseconds so there is no
+        # float rounding and wall clock adjustments cannot move the clock backwards
+        elapsed_ns = now_ns - self._start_ns
+        expected_samples = elapsed_ns * self._sample_rate // 1_000_000_000
+
+        missing = expected_samples - self._samples_generated
+        n = missing - missing % self._period_size
+        if n <= 0:
+            return
+        self._samples_generated += n
+        self._schedule_next_update()
+
+        # Only the most recent buffer_size samples stay visible, anything older
+        # would be overwritten within the same update, so it is not generated
+        n = min(n, self._buffer_size)
 
-        # Calculate expected samples based on elapsed time
-        elapsed = time.time() - self._start_time
-        expected_samples = int(elapsed * self._sample_rate)
+        if self._generator_into is None:
+            for _ in range(n // self._period_size):
+                self.write(self._generator())
+            return
 
-        # Generate missing samples in period_size chunks
-        while self._samples_generated + self._period_size <= expected_samples:
-            samples = self._generator()
-            self.write(samples)
-            self._samples_generated += self._period_size
+        # Generate straight into the ring storage, in as many pieces as the ring boundaries need
+        while n > 0:
+            slot = self.reserve(n)
+            if slot is None:
+                # Nobody is reading, the samples would be dropped anyway
+                return
+            self._generator_into(slot)
+            self.commit(len(slot))
+            n -= len(slot)
+
+    def _schedule_next_update(self):
+        """Compute when the period after the samples generated so far is due."""
+        due = self._samples_generated + self._period_size
+        # Rounded up, so the period is complete by then
+        self._next_update_ns = self._start_ns + -(-due * 1_000_000_000 // self._sample_rate)
 
     @property
     def data(self) -> Optional[np.ndarray]:
         """Get buffer data, generating missing samples first.
 
+        The same view object is returned until new samples are written or
+        the buffer is resized, so callers must not modify it.
+
         Returns:
             Numpy view of useful data (most recent samples ending at ptr),
             or None if not allocated
         """
         self._update()
-        return super().data
+        if (self._buffer is not self._view_buffer or self._ptr != self._view_ptr
+                or self._has_wrapped != self._view_wrapped
+                or self._buffer_size != self._view_size):
+            self._view = super().data
+            self._view_buffer = self._buffer
+            self._view_ptr = self._ptr
+            self._view_wrapped = self._has_wrapped
+            self._view_size = self._buffer_size
+        return self._view
+
+    def snapshot(self) -> Optional[np.ndarray]:
+        """Copy of the buffer data, nothing can write concurrently when single-threaded."""
+        view = self.data
+        return None if view is None else view.copy()
+
+    def snapshot_into(self, dst: np.ndarray, start: int = 0, length: Optional[int] = None) -> int:
+        """Copy the most recent samples into a caller-provided array.
+
+        Args:
+            dst: Destination array, filled from the start
+            start: Start of the copied range within data
+            length: Length of the copied range, None for the rest of data
+
+        Returns:
+            Number of samples copied, at most len(dst)
+        """
+        view = self.data
+        if view is None:
+            return 0
+        end = len(view) if length is None else min(start + length, len(view))
+        n = max(0, min(len(dst), end - start))
+        np.copyto(dst[:n], view[end - n:end])
+        return n
 
 
 @device
@@ -92,13 +204,15 @@ class WaveformDeviceST(AudioDevice):
     """Single-threaded waveform generator for Pyodide/WebAssembly environments."""
 
     def __init__(self, waveform_type: str, sample_rate: int = 48000,
-                 frequency: float = 440.0, period_size: int = 1024):
+                 frequency: float = 440.0, period_size: int = 1024,
+                 sample_format: str = "float32"):
         """
         Args:
             waveform_type: Type of waveform ("sine", "square", "triangle")
             sample_rate: Sample rate in Hz
             frequency: Waveform frequency in Hz
             period_size: Number of samples to generate per period
+            sample_format: Format of the ring buffer samples ("float32" or "int16" PCM)
         """
         AudioDevice.__init__(self)
 
@@ -106,20 +220,80 @@ class WaveformDeviceST(AudioDevice):
         self._sample_rate = sample_rate
         self._frequency = frequency
         self._period_size = period_size
+        self._sample_format = sample_format
+        self._format = _SAMPLE_FORMATS.get(sample_format)
         self._buffer_mediator = None
         self._ring_buffer = None
-        self._phase = 0.0
-        self._sample_buffer = np.zeros(period_size, dtype=np.float32)
+        self._phase = 0.0  # square/triangle phase, in cycles
+        # Float samples quantized into the ring buffer, only needed for int16 output. Every generator
+        # writes its output before reading it, so the buffers need no zeroing
+        self._sample_buffer = np.empty(period_size, dtype=np.float32) if self._format is np.int16 else None
+
+        # Sine oscillator: a unit phasor z = exp(i*phase) rotated by w = exp(i*period_size*dphi)
+        # once per period. Within a period sin(phase + k*dphi) = sin(k*dphi)*Re(z) + cos(k*dphi)*Im(z),
+        # with the per-sample ramps precomputed, so no sine is evaluated per sample
+        phase_increment = 2.0 * np.pi * frequency / sample_rate
+        ramp = np.arange(period_size, dtype=np.float64) * phase_increment
+        self._sin_ramp = np.sin(ramp).astype(np.float32)
+        self._cos_ramp = np.cos(ramp).astype(np.float32)
+        self._scratch_buffer = np.empty(period_size, dtype=np.float32)
+        self._phasor = complex(1.0, 0.0)
+        self._rotator = cmath.exp(1j * period_size * phase_increment)
+
+        # Square/triangle phase advance per period, in cycles, and the per-sample offsets within a
+        # period as uint32 phases; all fixed for the device, so a period starts from a single add
+        self._period_cycle_increment = (period_size * frequency / sample_rate) % 1.0
+        cycle_ramp = np.arange(period_size, dtype=np.float64) * (frequency / sample_rate) % 1.0
+        self._cycle_ramp = np.round(cycle_ramp * _PHASE_SCALE).astype(np.uint64).astype(np.uint32)
+
+        # Metadata that does not change for the device lifetime, status is filled in per call
+        self._metadata_template = {
+            "uid": self.uid,
+            "label": f"{waveform_type.capitalize()} ({frequency}Hz)",
+            "type": _TYPE_WAVEFORM_DEVICE,
+            "category": _CATEGORY_AUDIO_DEVICE,
+            "status": "stopped",
+            "capabilities": {
+                "openable": False,
+                "configurable": True,
+                "closeable": True,
+                "readable": True,
+                "writable": False
+            },
+            "details": {
+                "waveform-type": waveform_type,
+                "frequency": frequency,
+                "sample-rate": sample_rate,
+                "period-size": period_size,
+                "sample-format": sample_format
+            }
+        }
+
+        # Keys of the root metadata, without and with the mediator instance
+        self._metadata_keys = tuple(self._metadata_template)
+        self._metadata_keys_with_instance = self._metadata_keys + ("instance",)
+
+        # Period filler resolved once, the waveform type does not change for the device lifetime
+        self._fill_periods = {
+            "sine": self._generate_sine,
+            "square": self._generate_square,
+            "triangle": self._generate_triangle,
+        }.get(waveform_type)
 
     def init(self) -> Result[None]:
         """Initialize ring buffer and mediator."""
-        # Create on-demand ring buffer with generator callback
+        if self._fill_periods is None:
+            return Result.error(f"WaveformDeviceST: unknown waveform type '{self._waveform_type}'")
+        if self._format is None:
+            return Result.error(f"WaveformDeviceST: unsupported sample format '{self._sample_format}'")
+
+        # Create on-demand ring buffer, generating straight into its storage
         res = OnDemandAudioRingBuffer.create(
             sample_rate=self._sample_rate,
             initial_size=0,
             period_size=self._period_size,
-            format_type=np.float32,
-            generator=self._generate_waveform
+            format_type=self._format,
+            generator_into=self._generate_into
         )
         if not res:
             return Result.error("WaveformDeviceST: failed to create OnDemandAudioRingBuffer")
@@ -167,30 +341,70 @@ class WaveformDeviceST(AudioDevice):
         self.stop()
         return Ok(None)
 
-    def _generate_waveform(self) -> np.ndarray:
-        """Generate waveform samples and return the buffer."""
-        phase_increment = 2.0 * np.pi * self._frequency / self._sample_rate
-
-        np.multiply(np.arange(self._period_size, dtype=np.float32), phase_increment, out=self._sample_buffer)
-        np.add(self._sample_buffer, self._phase, out=self._sample_buffer)
-
-        self._phase = (self._phase + self._period_size * phase_increment) % (2.0 * np.pi)
-
-        if self._waveform_type == "sine":
-            np.sin(self._sample_buffer, out=self._sample_buffer)
-        elif self._waveform_type == "square":
-            np.sin(self._sample_buffer, out=self._sample_buffer)
-            np.sign(self._sample_buffer, out=self._sample_buffer)
-        elif self._waveform_type == "triangle":
-            np.divide(self._sample_buffer, 2.0 * np.pi, out=self._sample_buffer)
-            np.remainder(self._sample_buffer, 1.0, out=self._sample_buffer)
-            np.multiply(self._sample_buffer, 2.0, out=self._sample_buffer)
-            np.subtract(self._sample_buffer, 1.0, out=self._sample_buffer)
-            np.abs(self._sample_buffer, out=self._sample_buffer)
-            np.multiply(self._sample_buffer, 2.0, out=self._sample_buffer)
-            np.subtract(self._sample_buffer, 1.0, out=self._sample_buffer)
-
-        return self._sample_buffer
+    def _ensure_scratch(self, n_samples: int):
+        """Grow the scratch buffers so a fill of n_samples fits."""
+        if len(self._scratch_buffer) >= n_samples:
+            return
+        self._scratch_buffer = np.empty(n_samples, dtype=np.float32)
+        if self._sample_buffer is not None:
+            self._sample_buffer = np.empty(n_samples, dtype=np.float32)
+
+    def _generate_into(self, out: np.ndarray):
+        """Fill out, a multiple of period_size samples long, with consecutive periods."""
+        n_samples = len(out)
+        self._ensure_scratch(n_samples)
+        shape = (n_samples // self._period_size, self._period_size)
+        # float32 output is generated in place, int16 output goes through the float sample buffer
+        target = out if self._sample_buffer is None else self._sample_buffer[:n_samples]
+        self._fill_periods(target.reshape(shape), self._scratch_buffer[:n_samples].reshape(shape))
+        if target is not out:
+            # Samples are within [-1, 1], so scaling and casting in one pass cannot overflow
+            np.multiply(target, _INT16_SCALE, out=out, casting="unsafe")
+
+    def _rotate(self, out: np.ndarray, scratch: np.ndarray):
+        """Fill each row of out with one period of sine from the phasor, advancing it a period per row."""
+        periods = len(out)
+        phasors = self._phasor * self._rotator ** np.arange(periods)
+        np.multiply(self._sin_ramp, phasors.real.astype(np.float32)[:, None], out=out)
+        np.multiply(self._cos_ramp, phasors.imag.astype(np.float32)[:, None], out=scratch)
+        np.add(out, scratch, out=out)
+        z = complex(phasors[-1]) * self._rotator
+        # Renormalize so rounding errors cannot make the amplitude drift over time
+        self._phasor = z / abs(z)
+
+    def _fill_phase(self, scratch: np.ndarray) -> np.ndarray:
+        """Fill the rows of scratch with the uint32 phase of consecutive periods and return that view."""
+        phase = scratch.view(np.uint32)
+        periods = len(phase)
+        # Period start phases are tracked in float64 so the frequency is not quantized
+        offsets = (self._phase + np.arange(periods) * self._period_cycle_increment) % 1.0
+        # uint32 addition wraps around, which is exactly the wrap to the next cycle
+        np.add(self._cycle_ramp, (offsets * _PHASE_SCALE).astype(np.uint32)[:, None], out=phase)
+
+        self._phase = (self._phase + periods * self._period_cycle_increment) % 1.0
+        return phase
+
+    def _generate_sine(self, out: np.ndarray, scratch: np.ndarray):
+        """Fill the rows of out with consecutive periods of sine wave."""
+        self._rotate(out, scratch)
+
+    def _generate_square(self, out: np.ndarray, scratch: np.ndarray):
+        """Fill the rows of out with consecutive periods of square wave."""
+        # The top bit of the phase is the half of the cycle: shifted down arithmetically it is
+        # 0 or -1, or-ing in the low bit turns that into +1 or -1
+        phase = self._fill_phase(scratch).view(np.int32)
+        np.right_shift(phase, 31, out=phase)
+        np.bitwise_or(phase, 1, out=phase)
+        np.copyto(out, phase, casting="same_kind")
+
+    def _generate_triangle(self, out: np.ndarray, scratch: np.ndarray):
+        """Fill the rows of out with consecutive periods of triangle wave."""
+        # Read as int32 the phase is y in [-0.5, 0.5) cycles, and |4x - 2| - 1 over x in [0, 1)
+        # becomes 1 - 4|y|, so the fold needs no offset
+        np.copyto(out, self._fill_phase(scratch).view(np.int32), casting="same_kind")
+        np.multiply(out, _TRIANGLE_SCALE, out=out)
+        np.abs(out, out=out)
+        np.subtract(_ONE, out, out=out)
 
     def get_children_names(self, path: DataPath) -> Result[List[str]]:
         """Get children for browsing."""
@@ -201,41 +415,21 @@ class WaveformDeviceST(AudioDevice):
     def get_metadata(self, path: DataPath) -> Result[Dict]:
         """Get metadata for this device."""
         if len(path) == 0 or str(path) == "/":
-            meta = {
-                "uid": self.uid,
-                "label": f"{self._waveform_type.capitalize()} ({self._frequency}Hz)",
-                "type": "waveform-device-st",
-                "category": "audio-device",
-                "status": "running" if self.is_alive() else "stopped",
-                "capabilities": {
-                    "openable": False,
-                    "configurable": True,
-                    "closeable": True,
-                    "readable": True,
-                    "writable": False
-                },
-                "details": {
-                    "waveform-type": self._waveform_type,
-                    "frequency": self._frequency,
-                    "sample-rate": self._sample_rate,
-                    "period-size": self._period_size
-                }
-            }
+            meta = {**self._metadata_template, "status": "running" if self.is_alive() else "stopped"}
             if self._buffer_mediator:
                 meta["instance"] = self._buffer_mediator
             return Ok(meta)
 
         return Result.error(f"WaveformDeviceST: unknown path {path}")
 
-    def get_metadata_keys(self, path: DataPath) -> Result[list]:
-        """Get metadata keys using existing get_metadata."""
-        res = self.get_metadata(path)
-        if not res:
-            return Result.error(f"WaveformDeviceST: failed to get metadata for {path}", res)
-        metadata = res.unwrapped
-        if isinstance(metadata, dict):
-            return Ok(list(metadata.keys()))
-        return Result.error(f"WaveformDeviceST: metadata is not a dict at {path}")
+    def get_metadata_keys(self, path: DataPath) -> Result[tuple]:
+        """Get metadata keys, precomputed as the metadata shape is fixed."""
+        if len(path) == 0 or str(path) == "/":
+            if self._buffer_mediator:
+                return Ok(self._metadata_keys_with_instance)
+            return Ok(self._metadata_keys)
+
+        return Result.error(f"WaveformDeviceST: unknown path {path}")
 
     def get(self, path: DataPath) -> Result:
         """Get metadata value - last component of path is the key."""
@@ -268,14 +462,42 @@ class WaveformDeviceST(AudioDevice):
 class WaveformManagerST(AudioDeviceManager):
     """Single-threaded manager for waveform generators (Pyodide/WebAssembly)."""
 
-    WAVEFORMS = ["sine", "square", "triangle"]
+    WAVEFORMS = list(_WAVEFORMS)
 
     def __init__(self, dispatcher, plugin_manager, raw_arg=None):
         super().__init__()
         self._dispatcher = dispatcher
         self._plugin_manager = plugin_manager
         self._raw_arg = raw_arg
-        self._waveform_devices = {}
+        # Opened device per waveform, indexed by _WAVEFORM_INDEX (None when not opened)
+        self._waveform_devices: List[Optional[WaveformDeviceST]] = [None] * len(_WAVEFORMS)
+
+        # Metadata of the static part of the tree, built once and shared by all lookups
+        self._root_metadata = {
+            "uid": self.uid,
+            "name": "waveform-st",
+            "label": "Waveform Generator (Single-Threaded)",
+            "type": _TYPE_WAVEFORM_MANAGER,
+            "category": _CATEGORY_AUDIO_DEVICE_MANAGER,
+            "description": "Generates standard waveforms (sine, square, triangle) - single-threaded for Pyodide"
+        }
+        self._folder_metadata = {
+            branch: {
+                "name": branch,
+                "label": branch.capitalize(),
+                "type": _TYPE_FOLDER,
+                "category": _TYPE_FOLDER
+            }
+            for branch in _BRANCHES
+        }
+        self._available_metadata = {w: self._build_available_metadata(w) for w in self.WAVEFORMS}
+        self._channel_metadata = {w: self._build_channel_metadata(w) for w in self.WAVEFORMS}
+
+        # Keys of the static metadata, the same for every folder, waveform and channel
+        self._root_metadata_keys = tuple(self._root_metadata)
+        self._folder_metadata_keys = tuple(self._folder_metadata["available"])
+        self._available_metadata_keys = tuple(self._available_metadata[_WAVEFORMS[0]])
+        self._channel_metadata_keys = tuple(self._channel_metadata[_WAVEFORMS[0]])
 
     def init(self) -> Result[None]:
         """Initialize waveform manager."""
@@ -287,9 +509,10 @@ class WaveformManagerST(AudioDeviceManager):
 
     def dispose(self) -> Result[None]:
         """Clean up all waveform devices."""
-        for path, device in self._waveform_devices.items():
-            device.stop()
-        self._waveform_devices.clear()
+        for index, device in enumerate(self._waveform_devices):
+            if device is not None:
+                device.stop()
+                self._waveform_devices[index] = None
         return Ok(None)
 
     def get_children_names(self, path: DataPath) -> Result[List[str]]:
@@ -297,7 +520,7 @@ class WaveformManagerST(AudioDeviceManager):
         if len(path) == 0 or str(path) == "/":
             return Ok(["available", "opened"])
 
-        if len(path) > 0 and path[0] in ["available", "opened"]:
+        if len(path) > 0 and path[0] in _BRANCHES:
             branch = path[0]
             subpath = path[1:]
 
@@ -313,7 +536,7 @@ class WaveformManagerST(AudioDeviceManager):
         if len(path) == 0 or str(path) == "/":
             return Ok(self.WAVEFORMS)
 
-        if len(path) == 1 and path[0] in self.WAVEFORMS:
+        if len(path) == 1 and path[0] in _WAVEFORMS_SET:
             return Ok(["0"])
 
         return Ok([])
@@ -321,15 +544,12 @@ class WaveformManagerST(AudioDeviceManager):
     def _get_children_names_opened(self, path: DataPath) -> Result[List[str]]:
         """Get children for /opened branch."""
         if len(path) == 0 or str(path) == "/":
-            if len(self._waveform_devices) > 0:
-                return Ok([path[0] for path in self._waveform_devices.keys()])
-            return Ok([])
+            return Ok([w for w, device in zip(_WAVEFORMS, self._waveform_devices, strict=True) if device is not None])
 
-        if len(path) >= 1 and path[0] in self.WAVEFORMS:
-            device_path = DataPath("/" + path[0])
-            device = self._waveform_devices.get(device_path)
+        if len(path) >= 1 and path[0] in _WAVEFORMS_SET:
+            device = self._waveform_devices[_WAVEFORM_INDEX[path[0]]]
             if not device:
-                return Result.error(f"WaveformManagerST: device at {device_path} is not opened")
+                return Result.error(f"WaveformManagerST: device at /{path[0]} is not opened")
 
             subpath = DataPath(path.as_list[1:]) if len(path) > 1 else DataPath("/")
             return device.get_children_names(subpath)
@@ -339,24 +559,12 @@ class WaveformManagerST(AudioDeviceManager):
     def get_metadata(self, path: DataPath) -> Result[Dict]:
         """Get metadata for a path."""
         if len(path) == 0 or str(path) == "/":
-            return Ok({
-                "uid": self.uid,
-                "name": "waveform-st",
-                "label": "Waveform Generator (Single-Threaded)",
-                "type": "waveform-manager-st",
-                "category": "audio-device-manager",
-                "description": "Generates standard waveforms (sine, square, triangle) - single-threaded for Pyodide"
-            })
-
-        if len(path) == 1 and path[0] in ["available", "opened"]:
-            return Ok({
-                "name": path[0],
-                "label": path[0].capitalize(),
-                "type": "folder",
-                "category": "folder"
-            })
-
-        if len(path) > 0 and path[0] in ["available", "opened"]:
+            return Ok(self._root_metadata)
+
+        if len(path) == 1 and path[0] in _BRANCHES:
+            return Ok(self._folder_metadata[path[0]])
+
+        if len(path) > 0 and path[0] in _BRANCHES:
             branch = path[0]
             subpath = path[1:]
 
@@ -369,81 +577,93 @@ class WaveformManagerST(AudioDeviceManager):
 
     def _get_metadata_available(self, path: DataPath) -> Result[Dict]:
         """Get metadata for /available branch."""
-        if len(path) == 1 and path[0] in self.WAVEFORMS:
-            waveform_type = path[0]
-            return Ok({
-                "name": waveform_type,
-                "label": f"{waveform_type.capitalize()} Wave",
-                "type": "waveform-device-st",
-                "category": "audio-device",
-                "description": f"{waveform_type.capitalize()} waveform generator (single-threaded)",
-                "capabilities": {
-                    "openable": True,
-                    "readable": True,
-                    "writable": False
+        if len(path) == 1 and path[0] in _WAVEFORMS_SET:
+            return Ok(self._available_metadata[path[0]])
+
+        if len(path) == 2 and path[0] in _WAVEFORMS_SET and path[1] == "0":
+            return Ok(self._channel_metadata[path[0]])
+
+        return Result.error(f"WaveformManagerST: unknown available path {path}")
+
+    @staticmethod
+    def _build_available_metadata(waveform_type: str) -> Dict:
+        """Build the metadata of an available waveform endpoint."""
+        return {
+            "name": waveform_type,
+            "label": f"{waveform_type.capitalize()} Wave",
+            "type": _TYPE_WAVEFORM_DEVICE,
+            "category": _CATEGORY_AUDIO_DEVICE,
+            "description": f"{waveform_type.capitalize()} waveform generator (single-threaded)",
+            "capabilities": {
+                "openable": True,
+                "readable": True,
+                "writable": False
+            },
+            "details": {
+                "waveform-type": waveform_type
+            },
+            "config-schema": {
+                "frequency": {
+                    "type": "float",
+                    "default": 440.0,
+                    "min": 20.0,
+                    "max": 20000.0,
+                    "label": "Frequency (Hz)"
                 },
-                "details": {
-                    "waveform-type": waveform_type
+                "sample-rate": {
+                    "type": "int",
+                    "default": 48000,
+                    "choices": [44100, 48000, 96000],
+                    "label": "Sample Rate"
                 },
-                "config-schema": {
-                    "frequency": {
-                        "type": "float",
-                        "default": 440.0,
-                        "min": 20.0,
-                        "max": 20000.0,
-                        "label": "Frequency (Hz)"
-                    },
-                    "sample-rate": {
-                        "type": "int",
-                        "default": 48000,
-                        "choices": [44100, 48000, 96000],
-                        "label": "Sample Rate"
-                    },
-                    "period-size": {
-                        "type": "int",
-                        "default": 1024,
-                        "min": 128,
-                        "max": 8192,
-                        "label": "Period Size"
-                    }
-                }
-            })
-
-        if len(path) == 2 and path[0] in self.WAVEFORMS and path[1] == "0":
-            waveform_type = path[0]
-            return Ok({
-                "name": "0",
-                "label": "Channel 0",
-                "type": "audio-channel",
-                "category": "audio-channel",
-                "capabilities": {
-                    "openable": True,
-                    "readable": True,
-                    "writable": False
+                "period-size": {
+                    "type": "int",
+                    "default": 1024,
+                    "min": 128,
+                    "max": 8192,
+                    "label": "Period Size"
                 },
-                "details": {
-                    "channel-id": 0,
-                    "waveform-type": waveform_type
+                "sample-format": {
+                    "type": "str",
+                    "default": "float32",
+                    "choices": ["float32", "int16"],
+                    "label": "Sample Format"
                 }
-            })
-
-        return Result.error(f"WaveformManagerST: unknown available path {path}")
+            }
+        }
+
+    @staticmethod
+    def _build_channel_metadata(waveform_type: str) -> Dict:
+        """Build the metadata of the single channel of an available waveform."""
+        return {
+            "name": "0",
+            "label": "Channel 0",
+            "type": _TYPE_AUDIO_CHANNEL,
+            "category": _TYPE_AUDIO_CHANNEL,
+            "capabilities": {
+                "openable": True,
+                "readable": True,
+                "writable": False
+            },
+            "details": {
+                "channel-id": 0,
+                "waveform-type": waveform_type
+            }
+        }
 
     def _get_metadata_opened(self, path: DataPath) -> Result[Dict]:
         """Get metadata for /opened branch."""
-        if len(path) == 1 and path[0] in self.WAVEFORMS:
-            device_path = DataPath("/" + path[0])
-            device = self._waveform_devices.get(device_path)
+        if len(path) == 1 and path[0] in _WAVEFORMS_SET:
+            device = self._waveform_devices[_WAVEFORM_INDEX[path[0]]]
             if not device:
-                return Result.error(f"WaveformManagerST: device at {device_path} is not opened")
+                return Result.error(f"WaveformManagerST: device at /{path[0]} is not opened")
 
             return device.get_metadata(DataPath("/"))
 
-        if len(path) >= 2 and path[0] in self.WAVEFORMS:
-            device_path = DataPath("/" + path[0])
-            device = self._waveform_devices.get(device_path)
+        if len(path) >= 2 and path[0] in _WAVEFORMS_SET:
+            device = self._waveform_devices[_WAVEFORM_INDEX[path[0]]]
             if not device:
-                return Result.error(f"WaveformManagerST: device at {device_path} is not opened")
+                return Result.error(f"WaveformManagerST: device at /{path[0]} is not opened")
 
             subpath = DataPath(path.as_list[1:])
             return device.get_metadata(subpath)
@@ -452,53 +672,70 @@ class WaveformManagerST(AudioDeviceManager):
 
     def open(self, path: DataPath, config: dict) -> Result:
         """Open a waveform channel."""
-        if len(path) != 3 or path[0] != "available" or path[1] not in self.WAVEFORMS or path[2] != "0":
+        if len(path) != 3 or path[0] != "available" or path[1] not in _WAVEFORMS_SET or path[2] != "0":
             return Result.error(f"WaveformManagerST: invalid channel path {path}, expected /available/waveform_type/0")
 
         waveform_type = path[1]
-        device_path = DataPath("/" + waveform_type)
+        index = _WAVEFORM_INDEX[waveform_type]
 
-        if device_path not in self._waveform_devices:
+        if self._waveform_devices[index] is None:
             frequency = config.get("frequency", 440.0)
             sample_rate = config.get("sample_rate", 48000)
             period_size = config.get("period_size", 1024)
+            sample_format = config.get("sample_format", "float32")
 
             res = WaveformDeviceST.create(
                 waveform_type=waveform_type,
                 sample_rate=sample_rate,
                 frequency=frequency,
-                period_size=period_size
+                period_size=period_size,
+                sample_format=sample_format
             )
             if not res:
                 return Result.error(f"WaveformManagerST: failed to create {waveform_type} device", res)
 
             device = res.unwrapped
             device.start()
-            self._waveform_devices[device_path] = device
+            self._waveform_devices[index] = device
 
-        device = self._waveform_devices[device_path]
+        device = self._waveform_devices[index]
         return device.open(DataPath("/"), config)
 
     def close(self, path: DataPath) -> Result[None]:
         """Close a waveform generator."""
-        if path not in self._waveform_devices:
+        device = None
+        if len(path) == 1 and path[0] in _WAVEFORMS_SET:
+            device = self._waveform_devices[_WAVEFORM_INDEX[path[0]]]
+        if device is None:
             return Result.error(f"WaveformManagerST: device at {path} not opened")
 
-        device = self._waveform_devices[path]
         device.stop()
-        del self._waveform_devices[path]
+        self._waveform_devices[_WAVEFORM_INDEX[path[0]]] = None
 
         return Ok(None)
 
-    def get_metadata_keys(self, path: DataPath) -> Result[list]:
-        """Get metadata keys using existing get_metadata."""
-        res = self.get_metadata(path)
-        if not res:
-            return Result.error(f"WaveformManagerST: failed to get metadata for {path}", res)
-        metadata = res.unwrapped
-        if isinstance(metadata, dict):
-            return Ok(list(metadata.keys()))
-        return Result.error(f"WaveformManagerST: metadata is not a dict at {path}")
+    def get_metadata_keys(self, path: DataPath) -> Result[tuple]:
+        """Get metadata keys without building the metadata, precomputed for the static tree."""
+        if len(path) == 0 or str(path) == "/":
+            return Ok(self._root_metadata_keys)
+
+        if len(path) == 1 and path[0] in _BRANCHES:
+            return Ok(self._folder_metadata_keys)
+
+        if path[0] == "available" and len(path) >= 2 and path[1] in _WAVEFORMS_SET:
+            if len(path) == 2:
+                return Ok(self._available_metadata_keys)
+            if len(path) == 3 and path[2] == "0":
+                return Ok(self._channel_metadata_keys)
+
+        if path[0] == "opened" and len(path) >= 2 and path[1] in _WAVEFORMS_SET:
+            device = self._waveform_devices[_WAVEFORM_INDEX[path[1]]]
+            if not device:
+                return Result.error(f"WaveformManagerST: device at /{path[1]} is not opened")
+            subpath = DataPath(path.as_list[2:]) if len(path) > 2 else DataPath("/")
+            return device.get_metadata_keys(subpath)
+
+        return Result.error(f"WaveformManagerST: failed to get metadata for {path}")
 
     def get(self, path: DataPath) -> Result[Any]:
         """Get metadata value - last component of path is the key."""
@@ -4,6 +4,7 @@ All widgets use "activated" parameter for children, just like composite widgets
 """
 
 from imgui_bundle import implot, imgui
+import numpy as np
 from ymery.frontend.widget import Widget
 from ymery.decorators import widget
 from ymery.result import Result, Ok
@@ -18,6 +19,7 @@ class ImplotLayer(Widget):
     def __init__(self, widget_factory, dispatcher, namespace: str, data_bag):
         super().__init__(widget_factory, dispatcher, namespace, data_bag)
         self._cached_buffer = None
+        self._snapshot = None  # Reused across frames for snapshot_into()
 
     def _pre_render_head(self) -> Result[bool]:
         """Render plot layer - renders line plot from data"""
@@ -70,31 +72,51 @@ class ImplotLayer(Widget):
                     return Result.error(f"ImplotLayer: no buffer in metadata and not an openable channel ({data_path})")
                 self._cached_buffer = buffer  # Cache it!
 
+        # Immutable data (loaded files) is plotted in place, copying it would cost a full
+        # pass over the file per frame and there is no writer to protect it from
+        if getattr(buffer, 'is_static', False):
+            return self._plot_buffer_data(buffer.data)
+
+        # Plot a copy when the buffer can provide one, so the lock is not held while
+        # plotting and the writer (audio thread) never waits for a frame to render
+        if hasattr(buffer, 'snapshot_into'):
+            view = buffer.data  # Only used for the size and dtype of the copy
+            if view is None or len(view) == 0:
+                return Ok(False)  # No data to plot
+            size = len(view)
+            if self._snapshot is None or len(self._snapshot) < size or self._snapshot.dtype != view.dtype:
+                self._snapshot = np.empty(size, dtype=view.dtype)
+            # 0 when the buffer is busy, which skips this frame
+            copied = buffer.snapshot_into(self._snapshot[:size])
+            return self._plot_buffer_data(self._snapshot[:copied])
+
         # Try to lock buffer
         if not buffer.try_lock():
             return Ok(False)  # Buffer busy, skip this frame
 
         try:
-            # Get buffer data
-            buffer_data = buffer.data
-            if buffer_data is None or len(buffer_data) == 0:
-                return Ok(False)  # No data to plot
+            return self._plot_buffer_data(buffer.data)
+        finally:
+            buffer.unlock()
 
-            # X-axis: oldest sample at negative X, newest at 0
-            xstart = -float(len(buffer_data))
+    def _plot_buffer_data(self, buffer_data) -> Result[bool]:
+        """Plot buffer samples as a line"""
+        if buffer_data is None or len(buffer_data) == 0:
+            return Ok(False)  # No data to plot
 
-            # Get label from field values
-            label_res = self._data_bag.get("label")
-            if not label_res:
-                return Result.error("ImplotLayer: failed to get label", label_res)
-            label = label_res.unwrapped
+        # X-axis: oldest sample at negative X, newest at 0
+        xstart = -float(len(buffer_data))
 
-            # Plot line
-            implot.plot_line(label, buffer_data, xscale=1.0, xstart=xstart)
+        # Get label from field values
+        label_res = self._data_bag.get("label")
+        if not label_res:
+            return Result.error("ImplotLayer: failed to get label", label_res)
+        label = label_res.unwrapped
 
-            return Ok(False)  # Layer doesn't activate
-        finally:
-            buffer.unlock()
+        # Plot line
+        implot.plot_line(label, buffer_data, xscale=1.0, xstart=xstart)
+
+        return Ok(False)  # Layer doesn't activate
 
 
 @widget
@@ -4,7 +4,7 @@ types shared both by frontend and backend
 
 from abc import ABC, abstractmethod
 from .result import Result, Ok
-from typing import Union, List, Dict, Any
+from typing import Union, List, Dict, Any, Sequence
 from .stringcase import spinalcase
 
 from .logging import log
@@ -148,11 +148,16 @@ class DataPath:
         return len(self._path)
 
     def __eq__(self, other: Union[str, List[str], "DataPath"]):
+        # Dict lookups compare DataPath keys, skip the copy made by DataPath(other)
+        if isinstance(other, DataPath):
+            return self._path == other._path
         res= self._path == DataPath(other).as_list
         return res
 
 
     def __ne__(self, other: Union[str, List[str], "DataPath"]):
+        if isinstance(other, DataPath):
+            return self._path != other._path
         return self._path != DataPath(other).as_list
 
     def __hash__(self):
@@ -223,15 +228,16 @@ class TreeLike(ABC):
 
 
     @abstractmethod
-    def get_metadata_keys(self, path: DataPath) -> Result[list]:
+    def get_metadata_keys(self, path: DataPath) -> Result[Sequence[str]]:
         """
-        Returns metadata for a given internal-path.
+        Returns the metadata keys for a given internal-path.
 
         Args:
             path: Internal-path (relative to provider, starts with "/")
 
         Returns:
-            Metadata dictionary with "path" field identifying the node
+            List or tuple of the metadata keys, implementations may return a
+            cached tuple, so callers must not rely on mutating it
         """
         raise NotImplementedError("get_metadata_keys not implemented")
 
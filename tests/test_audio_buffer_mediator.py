@@ -0,0 +1,77 @@
+import numpy as np
+
+from ymery.backend.audio_buffer import (
+    DynamicAudioRingBuffer, DynamicAudioBufferMediator, FileAudioBuffer, StaticAudioBufferMediator,
+)
+from ymery.result import Ok
+
+
+class MemoryBuffer(FileAudioBuffer):
+    def dispose(self):
+        return Ok(None)
+
+
+def make_mediator():
+    source = DynamicAudioRingBuffer(48000, period_size=4)
+    return source, DynamicAudioBufferMediator(source)
+
+
+def test_set_length_and_set_start_update_the_source_range():
+    source, mediator = make_mediator()
+    wide = mediator.open(0, 8).unwrapped
+    narrow = mediator.open(0, 4).unwrapped
+    assert (mediator._max_end, source._buffer_size) == (8, 8)
+
+    wide.set_length(2)
+    assert (mediator._max_end, source._buffer_size) == (4, 4)
+
+    narrow.set_start(12)
+    assert (mediator._max_end, source._buffer_size) == (16, 16)
+
+    narrow.set_start(0)
+    assert (mediator._max_end, source._buffer_size) == (4, 4)
+
+
+def test_close_lowers_the_source_range_to_the_remaining_buffers():
+    source, mediator = make_mediator()
+    short = mediator.open(0, 4).unwrapped
+    grown = mediator.open(0, 4).unwrapped
+    grown.set_length(16)
+    assert (mediator._max_end, source._buffer_size) == (16, 16)
+
+    grown.close()
+    assert (mediator._max_end, source._buffer_size) == (4, 4)
+    assert list(mediator._mediated_buffers) == [short.uid]
+
+
+def test_snapshot_into_reads_the_mediated_range_without_the_lock():
+    source, mediator = make_mediator()
+    view = mediator.open(0, 8).unwrapped
+    source.activate()
+    source.write(np.arange(12, dtype=np.float32))
+    dst = np.zeros(8, dtype=np.float32)
+
+    source.lock()
+    try:
+        # The seqlock read of the ring buffer does not wait for the writer's lock
+        assert view.snapshot_into(dst) == 8
+    finally:
+        source.unlock()
+    np.testing.assert_array_equal(dst, np.arange(4, 12, dtype=np.float32))
+
+    view.set_range(0, 4)
+    source.write(np.arange(12, 16, dtype=np.float32))
+    assert view.snapshot_into(dst) == 4
+    np.testing.assert_array_equal(dst[:4], np.arange(12, 16, dtype=np.float32))
+    assert not view.is_static
+
+
+def test_static_source_views_are_static():
+    samples = np.arange(100, dtype=np.float32)
+    mediator = StaticAudioBufferMediator(MemoryBuffer("test.wav", samples, 48000))
+    view = mediator.open(10, 20).unwrapped
+    assert view.is_static
+    np.testing.assert_array_equal(view.data, samples[10:30])
+    dst = np.zeros(8, dtype=np.float32)
+    assert view.snapshot_into(dst) == 8
+    np.testing.assert_array_equal(dst, samples[22:30])
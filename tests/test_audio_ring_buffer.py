@@ -0,0 +1,173 @@
+import numpy as np
+import pytest
+
+from ymery.backend.audio_buffer import DynamicAudioRingBuffer
+
+
+PERIOD = 8
+
+
+class ReferenceRing:
+    """The last size samples written, kept in a plain list"""
+    def __init__(self, size):
+        self.size = size
+        self.samples = []
+
+    def write(self, data):
+        self.samples = (self.samples + list(data))[-self.size:]
+
+    def resize(self, size):
+        self.size = size
+        self.samples = self.samples[-size:]
+
+
+def make_buffer(size):
+    buffer = DynamicAudioRingBuffer(48000, initial_size=size, period_size=PERIOD)
+    buffer.activate()
+    return buffer
+
+
+def ramp(start, n):
+    return np.arange(start, start + n, dtype=np.float32)
+
+
+def assert_matches(buffer, reference):
+    np.testing.assert_array_equal(buffer.data, np.array(reference.samples, dtype=np.float32))
+
+
+@pytest.mark.parametrize("chunk_sizes", [
+    [3, 5, 7, 1, 16, 2],
+    [16, 16, 16],
+    [40, 3],  # Larger than the buffer
+    [15, 1, 15, 1, 33, 8],
+])
+def test_write_wraps_around(chunk_sizes):
+    buffer = make_buffer(16)
+    reference = ReferenceRing(16)
+    start = 0
+    for n in chunk_sizes:
+        chunk = ramp(start, n)
+        start += n
+        buffer.write(chunk)
+        reference.write(chunk)
+        assert_matches(buffer, reference)
+
+
+@pytest.mark.parametrize("written, new_size", [
+    (5, 32),  # Partially filled, grow
+    (5, 8),  # Partially filled, shrink below the samples held
+    (20, 32),  # Wrapped, grow
+    (20, 8),  # Wrapped, shrink
+    (16, 16),  # Unchanged size
+])
+def test_resize_keeps_last_samples(written, new_size):
+    buffer = make_buffer(16)
+    reference = ReferenceRing(16)
+    chunk = ramp(0, written)
+    buffer.write(chunk)
+    reference.write(chunk)
+
+    buffer.set_range(0, new_size)
+    reference.resize(new_size)
+    assert_matches(buffer, reference)
+
+    # Writing continues after the kept samples, across the new wrap point
+    for i in range(5):
+        chunk = ramp(100 + 7 * i, 7)
+        buffer.write(chunk)
+        reference.write(chunk)
+        assert_matches(buffer, reference)
+
+
+def write_reserved(buffer, data):
+    while len(data):
+        view = buffer.reserve(len(data))
+        assert view is not None and len(view) > 0
+        view[:] = data[:len(view)]
+        buffer.commit(len(view))
+        data = data[len(view):]
+
+
+def test_reserve_commit_across_wrap():
+    buffer = make_buffer(16)
+    reference = ReferenceRing(16)
+    buffer.write(ramp(0, 13))
+    reference.write(ramp(0, 13))
+
+    # Only the samples up to the wrap point are reserved at once
+    view = buffer.reserve(6)
+    assert len(view) == 3
+    view[:] = ramp(13, 3)
+    # Not visible before commit
+    assert_matches(buffer, reference)
+    buffer.commit(3)
+    reference.write(ramp(13, 3))
+    assert_matches(buffer, reference)
+
+    chunk = ramp(16, 21)
+    write_reserved(buffer, chunk)
+    reference.write(chunk)
+    assert_matches(buffer, reference)
+
+
+def test_commit_after_resize_drops_reserved_samples():
+    buffer = make_buffer(16)
+    buffer.write(ramp(0, 4))
+    view = buffer.reserve(4)
+    view[:] = 99
+    buffer.set_range(0, 32)
+    buffer.commit(4)
+    np.testing.assert_array_equal(buffer.data, ramp(0, 4))
+
+
+def test_inactive_or_frozen_buffer_drops_writes():
+    buffer = DynamicAudioRingBuffer(48000, initial_size=16, period_size=PERIOD)
+    buffer.write(ramp(0, 4))
+    assert buffer.data is None
+    assert buffer.reserve(4) is None
+
+    buffer.activate()
+    buffer.write(ramp(0, 4))
+    buffer.freeze()
+    buffer.write(ramp(4, 4))
+    assert buffer.reserve(4) is None
+    buffer.commit(4)
+    np.testing.assert_array_equal(buffer.data, ramp(0, 4))
+
+
+def test_snapshot_is_an_independent_copy():
+    buffer = make_buffer(16)
+    buffer.write(ramp(0, 21))
+    expected = ramp(5, 16)
+
+    snapshot = buffer.snapshot()
+    np.testing.assert_array_equal(snapshot, expected)
+    buffer.write(ramp(21, 4))
+    np.testing.assert_array_equal(snapshot, expected)
+    np.testing.assert_array_equal(buffer.snapshot(), ramp(9, 16))
+
+
+@pytest.mark.parametrize("dst_size", [4, 16, 32])
+def test_snapshot_into_copies_the_most_recent_samples(dst_size):
+    buffer = make_buffer(16)
+    buffer.write(ramp(0, 21))
+    dst = np.zeros(dst_size, dtype=np.float32)
+
+    n = buffer.snapshot_into(dst)
+    assert n == min(dst_size, 16)
+    np.testing.assert_array_equal(dst[:n], ramp(21 - n, n))
+
+
+def test_snapshot_while_locked():
+    buffer = make_buffer(16)
+    buffer.write(ramp(0, 4))
+    buffer.lock()
+    try:
+        # The seqlock read does not need the lock while no write is in progress
+        np.testing.assert_array_equal(buffer.snapshot(), ramp(0, 4))
+        # A write in progress makes snapshot_into give up rather than block
+        buffer._write_seq += 1
+        assert buffer.snapshot_into(np.zeros(4, dtype=np.float32)) == 0
+        buffer._write_seq += 1
+    finally:
+        buffer.unlock()
@@ -0,0 +1,62 @@
+from ymery.dispatcher import Dispatcher
+from ymery.result import Result, Ok
+
+
+class RecordingHandler:
+    def __init__(self, label, log, fail_on=None):
+        self.label = label
+        self.log = log
+        self.fail_on = fail_on
+
+    def handle_event(self, event):
+        self.log.append((self.label, event["source"], event["name"]))
+        if event["name"] == self.fail_on:
+            return Result.error(f"{self.label} failed")
+        return Ok(None)
+
+
+EVENTS = [
+    {"source": "tree", "name": "clicked"},
+    {"source": "tree", "name": "moved"},
+    {"source": "plot", "name": "moved"},
+    {"source": "tree", "name": "clicked"},
+    {"source": "tree"},  # Incomplete events are ignored
+]
+
+
+def make_dispatcher(log, fail_on=None):
+    dispatcher = Dispatcher()
+    dispatcher.register_event_handler("tree", RecordingHandler("tree", log))
+    dispatcher.register_event_handler("tree/clicked", RecordingHandler("tree/clicked", log, fail_on))
+    dispatcher.register_event_handler("plot/moved", RecordingHandler("plot/moved", log))
+    return dispatcher
+
+
+def test_dispatch_events_matches_sequential_dispatch():
+    expected = []
+    dispatcher = make_dispatcher(expected)
+    for event in EVENTS:
+        assert dispatcher.dispatch_event(event)
+
+    log = []
+    assert make_dispatcher(log).dispatch_events(EVENTS)
+    assert log == expected
+    assert log == [
+        ("tree/clicked", "tree", "clicked"),
+        ("tree", "tree", "clicked"),
+        ("tree", "tree", "moved"),
+        ("plot/moved", "plot", "moved"),
+        ("tree/clicked", "tree", "clicked"),
+        ("tree", "tree", "clicked"),
+    ]
+
+
+def test_dispatch_events_stops_at_first_error():
+    log = []
+    res = make_dispatcher(log, fail_on="clicked").dispatch_events(EVENTS)
+    assert not res
+    assert log == [("tree/clicked", "tree", "clicked")]
+
+
+def test_dispatch_events_without_handlers():
+    assert Dispatcher().dispatch_events(EVENTS)
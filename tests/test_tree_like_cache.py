@@ -0,0 +1,124 @@
+import threading
+import time
+
+from ymery.backend.types import TreeLikeCache
+from ymery.result import Ok
+from ymery.types import DataPath
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+
+class CountingCache(TreeLikeCache):
+    """Serves version-stamped entries, fetches block while the gate is closed"""
+    def __init__(self, **kwargs):
+        super().__init__(ttl=10.0, **kwargs)
+        self._time = FakeClock()
+        self.version = 0
+        self.calls = 0
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def get_children_names_uncached(self, path):
+        self.calls += 1
+        self.gate.wait(5.0)
+        return Ok([f"child{self.version}"])
+
+    def get_metadata_uncached(self, path):
+        self.calls += 1
+        self.gate.wait(5.0)
+        return Ok({f"key{self.version}": self.version})
+
+
+def wait_refreshed(cache, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while cache._inflight:
+        assert time.monotonic() < deadline, "background refresh did not finish"
+        time.sleep(0.001)
+
+
+PATH = DataPath("/a")
+
+
+def test_stale_hit_serves_old_entry_and_refreshes_in_background():
+    cache = CountingCache(stale_while_revalidate=True)
+    assert cache.get_children_names(PATH).unwrapped == ["child0"]
+    assert cache.get_metadata_keys(PATH).unwrapped == ("key0",)
+
+    cache.version = 1
+    cache._time.now = 12.0  # Past the TTL, within the stale period
+    cache.gate.clear()
+    assert cache.get_children_names(PATH).unwrapped == ["child0"]
+    assert cache.get_metadata(PATH).unwrapped == {"key0": 0}
+    # A second stale hit does not queue another refresh of the same path
+    assert cache.get_children_names(PATH).unwrapped == ["child0"]
+    assert len(cache._inflight) == 2
+
+    cache.gate.set()
+    wait_refreshed(cache)
+    assert cache.get_children_names(PATH).unwrapped == ["child1"]
+    assert cache.get_metadata_keys(PATH).unwrapped == ("key1",)
+    assert cache.calls == 4
+    cache.invalidate_cache()
+
+
+def test_invalidation_discards_refresh_started_before_it():
+    cache = CountingCache(stale_while_revalidate=True)
+    cache.get_children_names(PATH)
+    cache.version = 1
+    cache._time.now = 12.0
+    cache.gate.clear()
+    assert cache.get_children_names(PATH).unwrapped == ["child0"]
+    executor = cache._refresh_executor
+
+    cache.invalidate_cache()
+    assert cache._refresh_executor is None
+    cache.gate.set()
+    executor.shutdown(wait=True)
+    assert cache._children == {}
+
+    cache.version = 2
+    assert cache.get_children_names(PATH).unwrapped == ["child2"]
+
+
+def test_hard_expiry_refetches_synchronously():
+    cache = CountingCache(stale_while_revalidate=True)
+    cache.get_children_names(PATH)
+    cache.version = 1
+    cache._time.now = 25.0  # Past the stale period as well
+    assert cache.get_children_names(PATH).unwrapped == ["child1"]
+    assert cache._refresh_executor is None
+    assert cache.calls == 2
+
+
+def test_without_stale_while_revalidate_expiry_refetches_synchronously():
+    cache = CountingCache()
+    cache.get_children_names(PATH)
+    cache.version = 1
+    cache._time.now = 12.0
+    assert cache.get_children_names(PATH).unwrapped == ["child1"]
+    assert cache._refresh_executor is None
+
+
+def test_failed_background_refresh_is_cached_as_error(caplog):
+    class FailingCache(CountingCache):
+        def get_children_names_uncached(self, path):
+            if self.version:
+                raise OSError("backend gone")
+            return super().get_children_names_uncached(path)
+
+    cache = FailingCache(stale_while_revalidate=True)
+    cache.get_children_names(PATH)
+    cache.version = 1
+    cache._time.now = 12.0
+    assert cache.get_children_names(PATH).unwrapped == ["child0"]
+    wait_refreshed(cache)
+
+    assert not cache.get_children_names(PATH)
+    assert "backend gone" in caplog.text
+    cache.invalidate_cache()